@@ -29,7 +29,7 @@ The KB store deliberately does **not** import the embedding pipeline
 route runs the existing async chunker → ``bedrock_client.generate_embeddings_batch``
 flow already used by the populate pipeline in
 [commands/kb.py](commands/kb.py), then writes chunks via
-``kb_store.add_chunk``. The chunk replacement is done **after**
+``kb_store.add_chunks``. The chunk replacement is done **after**
 ``update_document`` returns (which has already cleared old chunks in a
 transaction), so a failure during embedding leaves the document with
 empty chunks rather than stale ones — explicitly logged as a warning so
@@ -142,7 +142,7 @@ def register_admin_kb_routes(
     re_embed_document:
         Async callable ``(doc_id: str, content: str) -> int`` that
         chunks + embeds ``content`` and writes chunks via
-        ``kb_store.add_chunk``, returning the number of chunks written.
+        ``kb_store.add_chunks``, returning the number of chunks written.
         Optional — when ``None``, content-changing PATCHes still clear
         old chunks (via the store) but leave the document un-embedded.
         That's an explicit operator decision (e.g. embedding model
@@ -442,7 +442,7 @@ def build_default_re_embed_callback(
     """Return an ``async (doc_id, content) -> int`` callback.
 
     Re-uses the same chunker + ``bedrock_client.generate_embeddings_batch``
-    + ``kb_store.add_chunk`` flow as the populate pipeline in
+    + ``kb_store.add_chunks`` flow as the populate pipeline in
     [commands/kb.py](commands/kb.py). Kept here as a free function so
     [plugin.py](plugin.py) can build it once at registration time and
     so tests can inject a stub without touching the route module.
@@ -485,27 +485,31 @@ def build_default_re_embed_callback(
             texts=texts, model_id=embedding_model, batch_size=batch_size
         )
 
-        for idx, (chunk_data, embedding) in enumerate(zip(chunks_data, embeddings)):
-            chunk_id = f"{doc_id}_{idx}"
-            chunk_metadata = {
-                "doc_id": doc_id,
-                "title": raw.get("title", ""),
-                "source": raw.get("source"),
-                "url": raw.get("source_url"),
-                "topic": raw.get("topic"),
-                "date_published": raw.get("date_published"),
-            }
-            await asyncio.to_thread(
-                kb_store.add_chunk,
-                chunk_id=chunk_id,
-                document_id=doc_id,
-                content=chunk_data["text"],
-                embedding=embedding,
-                chunk_index=idx,
-                start_char=chunk_data.get("start_char"),
-                end_char=chunk_data.get("end_char"),
-                metadata=chunk_metadata,
-            )
+        chunk_metadata = {
+            "doc_id": doc_id,
+            "title": raw.get("title", ""),
+            "source": raw.get("source"),
+            "url": raw.get("source_url"),
+            "topic": raw.get("topic"),
+            "date_published": raw.get("date_published"),
+        }
+        # One batched write (a single transaction on SQLite) for all chunks.
+        await asyncio.to_thread(
+            kb_store.add_chunks,
+            [
+                {
+                    "chunk_id": f"{doc_id}_{idx}",
+                    "document_id": doc_id,
+                    "content": chunk_data["text"],
+                    "embedding": embedding,
+                    "chunk_index": idx,
+                    "start_char": chunk_data.get("start_char"),
+                    "end_char": chunk_data.get("end_char"),
+                    "metadata": chunk_metadata,
+                }
+                for idx, (chunk_data, embedding) in enumerate(zip(chunks_data, embeddings))
+            ],
+        )
 
         return len(chunks_data)
 
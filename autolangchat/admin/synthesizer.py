@@ -618,7 +618,7 @@ class FeedbackSynthesizer:
         kb_store: BaseKBStore,
         bedrock_client: Any,
     ) -> None:
-        """Chunk ``content``, generate embeddings, and store via ``kb_store.add_chunk``."""
+        """Chunk ``content``, generate embeddings, and store via ``kb_store.add_chunks``."""
         chunks = self._chunker.chunk_text(content)
         if not chunks:
             logger.warning("_embed_and_add_chunks: no chunks produced for doc_id='%s'", doc_id)
@@ -634,14 +634,18 @@ class FeedbackSynthesizer:
                 "aborting to avoid persisting an incomplete chunk set"
             )
 
-        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            await asyncio.to_thread(
-                kb_store.add_chunk,
-                f"{doc_id}__chunk_{i}",
-                doc_id,
-                chunk["text"],
-                embedding,
-                i,
-                chunk.get("start_char"),
-                chunk.get("end_char"),
-            )
+        await asyncio.to_thread(
+            kb_store.add_chunks,
+            [
+                {
+                    "chunk_id": f"{doc_id}__chunk_{i}",
+                    "document_id": doc_id,
+                    "content": chunk["text"],
+                    "embedding": embedding,
+                    "chunk_index": i,
+                    "start_char": chunk.get("start_char"),
+                    "end_char": chunk.get("end_char"),
+                }
+                for i, (chunk, embedding) in enumerate(zip(chunks, embeddings))
+            ],
+        )
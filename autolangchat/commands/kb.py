@@ -323,30 +323,31 @@ async def kb_populate(
                         texts=texts, model_id=config.kb_embedding_model, batch_size=25
                     )
 
-                    # Store chunks with embeddings and proper metadata
-                    for idx, (chunk_data, embedding) in enumerate(zip(chunks_data, embeddings)):
-                        chunk_id = f"{doc_url}_{idx}"
-
-                        # Build chunk metadata with document references
-                        chunk_metadata = {
-                            "doc_id": doc_url,
-                            "title": doc.get("title", ""),
-                            "source": source_name,
-                            "url": doc_url,
-                            "topic": source.get("topic"),
-                            "date_published": None,
-                        }
-
-                        vector_db.add_chunk(
-                            chunk_id=chunk_id,
-                            document_id=doc_url,
-                            content=chunk_data["text"],
-                            embedding=embedding,
-                            chunk_index=idx,
-                            start_char=chunk_data.get("start_char"),
-                            end_char=chunk_data.get("end_char"),
-                            metadata=chunk_metadata,
-                        )
+                    # Store chunks with embeddings and proper metadata.
+                    # Chunk metadata carries the document references.
+                    chunk_metadata = {
+                        "doc_id": doc_url,
+                        "title": doc.get("title", ""),
+                        "source": source_name,
+                        "url": doc_url,
+                        "topic": source.get("topic"),
+                        "date_published": None,
+                    }
+                    vector_db.add_chunks(
+                        [
+                            {
+                                "chunk_id": f"{doc_url}_{idx}",
+                                "document_id": doc_url,
+                                "content": chunk_data["text"],
+                                "embedding": embedding,
+                                "chunk_index": idx,
+                                "start_char": chunk_data.get("start_char"),
+                                "end_char": chunk_data.get("end_char"),
+                                "metadata": chunk_metadata,
+                            }
+                            for idx, (chunk_data, embedding) in enumerate(zip(chunks_data, embeddings))
+                        ]
+                    )
 
                     total_chunks += len(chunks_data)
                     total_documents += 1
@@ -422,30 +423,31 @@ async def kb_populate(
                             texts=texts, model_id=config.kb_embedding_model, batch_size=25
                         )
 
-                        # Store chunks with embeddings and proper metadata
-                        for idx, (chunk_data, embedding) in enumerate(zip(chunks_data, embeddings)):
-                            chunk_id = f"{doc_id}_{idx}"
-
-                            # Build chunk metadata with document references
-                            chunk_metadata = {
-                                "doc_id": doc_id,
-                                "title": os.path.basename(file_path),
-                                "source": source_name,
-                                "url": None,
-                                "topic": source.get("topic"),
-                                "date_published": None,
-                            }
-
-                            vector_db.add_chunk(
-                                chunk_id=chunk_id,
-                                document_id=doc_id,
-                                content=chunk_data["text"],
-                                embedding=embedding,
-                                chunk_index=idx,
-                                start_char=chunk_data.get("start_char"),
-                                end_char=chunk_data.get("end_char"),
-                                metadata=chunk_metadata,
-                            )
+                        # Store chunks with embeddings and proper metadata.
+                        # Chunk metadata carries the document references.
+                        chunk_metadata = {
+                            "doc_id": doc_id,
+                            "title": os.path.basename(file_path),
+                            "source": source_name,
+                            "url": None,
+                            "topic": source.get("topic"),
+                            "date_published": None,
+                        }
+                        vector_db.add_chunks(
+                            [
+                                {
+                                    "chunk_id": f"{doc_id}_{idx}",
+                                    "document_id": doc_id,
+                                    "content": chunk_data["text"],
+                                    "embedding": embedding,
+                                    "chunk_index": idx,
+                                    "start_char": chunk_data.get("start_char"),
+                                    "end_char": chunk_data.get("end_char"),
+                                    "metadata": chunk_metadata,
+                                }
+                                for idx, (chunk_data, embedding) in enumerate(zip(chunks_data, embeddings))
+                            ]
+                        )
 
                         total_chunks += len(chunks_data)
                         total_documents += 1
@@ -470,10 +472,7 @@ async def kb_populate(
         return True
 
     except Exception as e:
-        logger.error(f"❌ Failed to populate knowledge base: {e}")
-        import traceback
-
-        logger.error(traceback.format_exc())
+        logger.exception(f"❌ Failed to populate knowledge base: {e}")
         if "vector_db" in locals():
             vector_db.close()
         return False
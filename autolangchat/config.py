@@ -459,6 +459,18 @@ class ChatConfig(BaseSettings):
         ),
     )
 
+    auth_verification_cache_ttl: int = Field(
+        default=0,
+        alias="AUTOCHAT_AUTH_VERIFICATION_CACHE_TTL",
+        ge=0,
+        description=(
+            "Seconds to remember a successful auth_verification_endpoint response for the same "
+            "credentials, so reconnecting clients skip the verification round-trip. Failed "
+            "verifications are never cached. 0 (default) verifies every auth message, so "
+            "revocations take effect immediately."
+        ),
+    )
+
     include_auth_info_in_prompts: bool = Field(
         default=False,
         alias="AUTOCHAT_INCLUDE_AUTH_INFO_IN_PROMPTS",
@@ -1072,7 +1084,7 @@ class ChatConfig(BaseSettings):
         alias="KB_SEMANTIC_WEIGHT",
         ge=0.0,
         le=1.0,
-        description="Weight for semantic (embedding) similarity in KB search (default: 0.7). Set to 0 to disable semantic matching.",
+        description="Weight for semantic (embedding) similarity in KB search (default: 0.7). Set to 0 to disable semantic matching (the query is then not embedded).",
     )
 
     kb_keyword_weight: float = Field(
@@ -1083,6 +1095,15 @@ class ChatConfig(BaseSettings):
         description="Weight for keyword (word-matching) score in KB search (default: 0.3). Set to 0 to disable keyword matching.",
     )
 
+    kb_fusion_method: str = Field(
+        default="weighted",
+        alias="KB_FUSION_METHOD",
+        description=(
+            "How hybrid KB search combines semantic and keyword results: 'weighted' (weighted score sum, default) "
+            "or 'rrf' (Reciprocal Rank Fusion, rank-based and insensitive to score scales)."
+        ),
+    )
+
     kb_credibility_decay_enabled: bool = Field(
         default=False,
         alias="AUTOCHAT_KB_CREDIBILITY_DECAY_ENABLED",
@@ -1255,6 +1276,15 @@ class ChatConfig(BaseSettings):
             )
         return v
 
+    @field_validator("kb_fusion_method")
+    @classmethod
+    def validate_kb_fusion_method(cls, v: str) -> str:
+        """Validate hybrid-search fusion method is a known value"""
+        valid_methods = {"weighted", "rrf"}
+        if v.lower() not in valid_methods:
+            raise ValueError(f"kb_fusion_method must be one of: {', '.join(sorted(valid_methods))}. Got: {v}")
+        return v.lower()
+
     @field_validator("sso_provider")
     @classmethod
     def validate_sso_provider(cls, v):
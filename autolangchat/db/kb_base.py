@@ -8,14 +8,67 @@ backend selected by ``ChatConfig.kb_storage_type``.
 
 from __future__ import annotations
 
+import heapq
+import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models import KBDocument, KBDocumentListFilters
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+#: Fusion strategies accepted by ``hybrid_search(fusion=...)``.
+HYBRID_FUSION_METHODS = ("weighted", "rrf")
+
+#: Rank-smoothing constant for Reciprocal Rank Fusion (Cormack et al., 2009).
+RRF_K = 60
+
+
+def loads_metadata(raw: Any) -> Dict[str, Any]:
+    """Decode a stored ``metadata`` JSON column, returning ``{}`` when empty.
+
+    Search results decode one metadata blob per row, so this uses
+    ``orjson`` when it is installed and falls back to :mod:`json` — also
+    for values orjson rejects, such as the ``NaN`` that ``json.dumps`` emits.
+    """
+    if not raw:
+        return {}
+    result: Dict[str, Any]
+    if orjson is not None:
+        try:
+            result = orjson.loads(raw)
+            return result
+        except orjson.JSONDecodeError:
+            pass
+    result = json.loads(raw)
+    return result
+
+
+def dumps_chunk_metadata(chunks: List[Dict[str, Any]]) -> List[Optional[str]]:
+    """Encode each chunk's ``metadata`` for storage (``None`` when empty).
+
+    Ingest passes one metadata dict shared by every chunk of a document,
+    so each distinct dict is serialised once per batch. Encoding stays on
+    :mod:`json` so stored values round-trip exactly (orjson would turn
+    ``NaN`` into ``null``).
+    """
+    encoded: Dict[int, Optional[str]] = {}
+    result: List[Optional[str]] = []
+    for chunk in chunks:
+        metadata = chunk.get("metadata")
+        key = id(metadata)
+        if key not in encoded:
+            encoded[key] = json.dumps(metadata) if metadata else None
+        result.append(encoded[key])
+    return result
+
 
 class BaseKBStore(ABC):
     """Abstract interface for knowledge-base storage backends.
@@ -143,6 +196,16 @@ class BaseKBStore(ABC):
     ) -> None:
         """Insert or replace a chunk with its embedding vector."""
 
+    def add_chunks(self, chunks: List[Dict[str, Any]]) -> None:
+        """Insert or replace several chunks.
+
+        Each entry holds the keyword arguments of :meth:`add_chunk`.
+        Backends override this to write the whole batch in one
+        transaction; the default simply calls :meth:`add_chunk` per entry.
+        """
+        for chunk in chunks:
+            self.add_chunk(**chunk)
+
     # ------------------------------------------------------------------
     # Search operations
     # ------------------------------------------------------------------
@@ -172,15 +235,266 @@ class BaseKBStore(ABC):
     def hybrid_search(
         self,
         query: str,
-        query_embedding: List[float],
+        query_embedding: Optional[List[float]],
         limit: int = 3,
         min_score: float = 0.0,
         filters: Optional[Dict[str, Any]] = None,
         semantic_weight: float = 0.7,
         keyword_weight: float = 0.3,
         exclude_flagged: bool = True,
+        fusion: str = "weighted",
+        keyword_results: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Combined semantic + keyword search with configurable weights.
+
+        *fusion* selects how the two result lists are combined:
+        ``"weighted"`` sums the weighted raw scores, ``"rrf"`` sums weighted
+        reciprocal ranks (see :meth:`_score_rrf_candidates`).
+
+        When *query_embedding* is ``None`` or *semantic_weight* is ``0`` the
+        vector search is skipped and only keyword matches are fused, so
+        callers need not embed the query at all.  Likewise a zero
+        *keyword_weight* skips the keyword search.
+
+        *keyword_results* lets a caller pass a :meth:`keyword_search` it ran
+        itself (e.g. concurrently with embedding the query, using the same
+        *filters* and :meth:`hybrid_candidate_limit`); the store then skips
+        its own keyword search.
+        """
+
+    def hybrid_search_multi(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]],
+        weight_pairs: List[Tuple[float, float]],
+        limit: int = 3,
+        min_score: float = 0.0,
+        filters: Optional[Dict[str, Any]] = None,
+        exclude_flagged: bool = True,
+        fusion: str = "weighted",
+    ) -> List[List[Dict[str, Any]]]:
+        """Run :meth:`hybrid_search` for several ``(semantic, keyword)`` weight pairs.
+
+        Semantic and keyword retrieval run once; only the fusion is repeated
+        per pair.  Returns one result list per entry in *weight_pairs*, each
+        identical to what the corresponding ``hybrid_search`` call returns —
+        except that, retrieval being shared, a zero weight in one pair does
+        not skip that search.  Pass ``query_embedding=None`` for keyword-only
+        retrieval.
+        """
+        self._check_fusion(fusion)
+        semantic_results, keyword_results = self._hybrid_candidates(
+            query, query_embedding, limit, filters, exclude_flagged
+        )
+        candidates = self._merge_hybrid_candidates(semantic_results, keyword_results)
+        return [
+            self._score_candidates(
+                candidates, semantic_results, keyword_results, semantic_weight, keyword_weight, min_score, limit, fusion
+            )
+            for semantic_weight, keyword_weight in weight_pairs
+        ]
+
+    # ------------------------------------------------------------------
+    # Hybrid fusion helpers (shared by the concrete backends)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def hybrid_candidate_limit(limit: int) -> int:
+        """Size of the candidate pool each search contributes to a hybrid query.
+
+        Both searches over-fetch so fusion has enough candidates to re-rank.
+        Callers that prefetch ``keyword_results`` for :meth:`hybrid_search`
+        should request this many.
+        """
+        return limit * 3
+
+    def _hybrid_candidates(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]],
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        exclude_flagged: bool,
+        keyword_results: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Fetch the semantic and keyword candidate pools for hybrid fusion.
+
+        Without a *query_embedding* the semantic pool is empty; prefetched
+        *keyword_results* are used as-is instead of searching again.
+        """
+        candidate_limit = self.hybrid_candidate_limit(limit)
+        semantic_results: List[Dict[str, Any]] = []
+        if query_embedding is not None:
+            semantic_results = self.semantic_search(
+                query_embedding=query_embedding,
+                limit=candidate_limit,
+                min_score=0.0,
+                filters=filters,
+                exclude_flagged=exclude_flagged,
+            )
+        if keyword_results is None:
+            keyword_results = self.keyword_search(
+                query=query,
+                limit=candidate_limit,
+                filters=filters,
+                exclude_flagged=exclude_flagged,
+            )
+        return semantic_results, keyword_results
+
+    @staticmethod
+    def _merge_hybrid_candidates(
+        semantic_results: List[Dict[str, Any]],
+        keyword_results: List[Dict[str, Any]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Merge both candidate lists by ``chunk_id``.
+
+        Each merged row carries ``semantic_score`` and ``keyword_score``
+        (``0.0`` when the chunk only appeared in the other list).
+        """
+        combined: Dict[str, Dict[str, Any]] = {}
+
+        for r in semantic_results:
+            cid = r["chunk_id"]
+            combined[cid] = r.copy()
+            combined[cid]["semantic_score"] = r["similarity_score"]
+            combined[cid]["keyword_score"] = 0.0
+
+        for r in keyword_results:
+            cid = r["chunk_id"]
+            if cid in combined:
+                combined[cid]["keyword_score"] = r["keyword_score"]
+            else:
+                combined[cid] = r.copy()
+                combined[cid]["semantic_score"] = 0.0
+                combined[cid]["keyword_score"] = r["keyword_score"]
+
+        return combined
+
+    @staticmethod
+    def _score_hybrid_candidates(
+        candidates: Dict[str, Dict[str, Any]],
+        semantic_weight: float,
+        keyword_weight: float,
+        min_score: float,
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Weighted-sum fusion of merged candidates, sorted and cut to *limit*.
+
+        Returns new dicts, so *candidates* can be re-scored with other weights.
+        """
+        scored: List[Tuple[float, Dict[str, Any]]] = []
+        for data in candidates.values():
+            score = semantic_weight * data["semantic_score"] + keyword_weight * data["keyword_score"]
+            if score >= min_score:
+                scored.append((round(score, 4), data))
+
+        return BaseKBStore._top_hybrid_results(scored, limit)
+
+    @staticmethod
+    def _score_rrf_candidates(
+        candidates: Dict[str, Dict[str, Any]],
+        semantic_results: List[Dict[str, Any]],
+        keyword_results: List[Dict[str, Any]],
+        semantic_weight: float,
+        keyword_weight: float,
+        min_score: float,
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Weighted Reciprocal Rank Fusion of merged candidates.
+
+        Each list contributes ``weight / (RRF_K + rank)``; only ranks are
+        used, so the raw semantic and BM25 scales never need reconciling.
+        The sum is scaled so a chunk ranked first in every weighted list
+        scores ``1.0``, keeping *min_score* meaningful.
+        """
+        total_weight = semantic_weight + keyword_weight
+        scale = (RRF_K + 1) / total_weight if total_weight > 0 else 0.0
+        semantic_ranks = {r["chunk_id"]: rank for rank, r in enumerate(semantic_results, 1)}
+        keyword_ranks = {r["chunk_id"]: rank for rank, r in enumerate(keyword_results, 1)}
+
+        scored: List[Tuple[float, Dict[str, Any]]] = []
+        for cid, data in candidates.items():
+            score = 0.0
+            if cid in semantic_ranks:
+                score += semantic_weight / (RRF_K + semantic_ranks[cid])
+            if cid in keyword_ranks:
+                score += keyword_weight / (RRF_K + keyword_ranks[cid])
+            score *= scale
+            if score >= min_score:
+                scored.append((round(score, 4), data))
+
+        return BaseKBStore._top_hybrid_results(scored, limit)
+
+    @staticmethod
+    def _top_hybrid_results(scored: List[Tuple[float, Dict[str, Any]]], limit: int) -> List[Dict[str, Any]]:
+        """Build result rows for the *limit* best ``(score, candidate)`` pairs.
+
+        ``heapq.nlargest`` selects the winners without sorting the whole
+        pool (ties keep candidate order, as a stable sort would), and only
+        the winners get a result dict.
+        """
+        return [
+            {
+                **data,
+                "similarity_score": score,  # main score for compatibility
+                "hybrid_score": score,
+                "semantic_component": round(data["semantic_score"], 4),
+                "keyword_component": round(data["keyword_score"], 4),
+            }
+            for score, data in heapq.nlargest(limit, scored, key=itemgetter(0))
+        ]
+
+    @staticmethod
+    def _check_fusion(fusion: str) -> None:
+        if fusion not in HYBRID_FUSION_METHODS:
+            raise ValueError(f"Unknown fusion method {fusion!r}; expected one of {', '.join(HYBRID_FUSION_METHODS)}")
+
+    @classmethod
+    def _score_candidates(
+        cls,
+        candidates: Dict[str, Dict[str, Any]],
+        semantic_results: List[Dict[str, Any]],
+        keyword_results: List[Dict[str, Any]],
+        semantic_weight: float,
+        keyword_weight: float,
+        min_score: float,
+        limit: int,
+        fusion: str,
+    ) -> List[Dict[str, Any]]:
+        """Dispatch merged candidates to the scorer for *fusion*."""
+        if fusion == "rrf":
+            return cls._score_rrf_candidates(
+                candidates, semantic_results, keyword_results, semantic_weight, keyword_weight, min_score, limit
+            )
+        return cls._score_hybrid_candidates(candidates, semantic_weight, keyword_weight, min_score, limit)
+
+    def _fuse_hybrid(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]],
+        limit: int,
+        min_score: float,
+        filters: Optional[Dict[str, Any]],
+        semantic_weight: float,
+        keyword_weight: float,
+        exclude_flagged: bool,
+        fusion: str,
+        keyword_results: Optional[List[Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
-        """Combined semantic + keyword search with configurable weights."""
+        """Retrieve, merge and score candidates — the body of ``hybrid_search``."""
+        self._check_fusion(fusion)
+        # A zero-weighted side cannot move the fused ranking; skip its search.
+        if semantic_weight == 0:
+            query_embedding = None
+        if keyword_weight == 0:
+            keyword_results = []
+        semantic_results, keyword_results = self._hybrid_candidates(
+            query, query_embedding, limit, filters, exclude_flagged, keyword_results
+        )
+        candidates = self._merge_hybrid_candidates(semantic_results, keyword_results)
+        return self._score_candidates(
+            candidates, semantic_results, keyword_results, semantic_weight, keyword_weight, min_score, limit, fusion
+        )
 
     # ------------------------------------------------------------------
     # Lifecycle / stats
@@ -21,12 +21,24 @@ from typing import Any, Dict, List, Optional
 
 from ..exceptions import KBDocumentNotFoundError
 from ..models import KBDocument, KBDocumentListFilters
-from .kb_base import BaseKBStore
+from .kb_base import BaseKBStore, dumps_chunk_metadata, loads_metadata
 
 logger = logging.getLogger(__name__)
 
 _SQL_DIR = Path(__file__).resolve().parent / "sql"
 
+
+def _vector_literal(values: Any) -> str:
+    """Format an embedding (list or ndarray) as a pgvector literal ``[v1,v2,…]``.
+
+    ``json.dumps`` serialises the floats in C, instead of one ``str()``
+    call per dimension.
+    """
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    return json.dumps(values, separators=(",", ":"))
+
+
 # ---------------------------------------------------------------------------
 # Lazy-check for the optional ``psycopg`` dependency so that callers get a
 # clear error instead of a confusing ImportError deep inside init.
@@ -190,7 +202,7 @@ class PgVectorKBStore(BaseKBStore):
                     "source_url": row[4],
                     "topic": row[5],
                     "date_published": row[6],
-                    "metadata": json.loads(row[7]) if row[7] else {},
+                    "metadata": loads_metadata(row[7]),
                     "created_at": str(row[8]) if row[8] else None,
                     "credibility_score": float(row[9]) if row[9] is not None else 1.0,
                     "removal_flagged": bool(row[10]) if row[10] is not None else False,
@@ -247,14 +259,42 @@ class PgVectorKBStore(BaseKBStore):
         end_char: Optional[int] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
-        meta_json = json.dumps(metadata) if metadata else None
-        # Convert to a string pgvector can parse: '[0.1,0.2,…]'
-        emb_str = "[" + ",".join(str(v) for v in embedding) + "]"
+        self.add_chunks(
+            [
+                {
+                    "chunk_id": chunk_id,
+                    "document_id": document_id,
+                    "content": content,
+                    "embedding": embedding,
+                    "chunk_index": chunk_index,
+                    "start_char": start_char,
+                    "end_char": end_char,
+                    "metadata": metadata,
+                }
+            ]
+        )
+
+    def add_chunks(self, chunks: List[Dict[str, Any]]) -> None:
+        if not chunks:
+            return
+        rows = [
+            (
+                c["chunk_id"],
+                c["document_id"],
+                c["content"],
+                c["chunk_index"],
+                c.get("start_char"),
+                c.get("end_char"),
+                metadata,
+                _vector_literal(c["embedding"]),
+            )
+            for c, metadata in zip(chunks, dumps_chunk_metadata(chunks))
+        ]
 
         with self._get_conn() as conn:
             self._register_on(conn)
             with conn.cursor() as cur:
-                cur.execute(
+                cur.executemany(
                     """
                     INSERT INTO chunks
                         (id, document_id, content, chunk_index, start_char, end_char,
@@ -269,7 +309,7 @@ class PgVectorKBStore(BaseKBStore):
                         metadata    = EXCLUDED.metadata,
                         embedding   = EXCLUDED.embedding
                     """,
-                    (chunk_id, document_id, content, chunk_index, start_char, end_char, meta_json, emb_str),
+                    rows,
                 )
             conn.commit()
 
@@ -309,7 +349,7 @@ class PgVectorKBStore(BaseKBStore):
         exclude_flagged: bool = True,
     ) -> List[Dict[str, Any]]:
         filter_sql, filter_params = self._build_filter_clause(filters)
-        emb_str = "[" + ",".join(str(v) for v in query_embedding) + "]"
+        emb_str = _vector_literal(query_embedding)
         flagged_sql = " AND d.removal_flagged = false" if exclude_flagged else ""
 
         sql = f"""
@@ -360,7 +400,7 @@ class PgVectorKBStore(BaseKBStore):
                     "source_url": row[6],
                     "topic": row[7],
                     "date_published": row[8],
-                    "metadata": json.loads(row[9]) if row[9] else {},
+                    "metadata": loads_metadata(row[9]),
                     "similarity_score": round(similarity, 4),
                 }
             )
@@ -421,7 +461,7 @@ class PgVectorKBStore(BaseKBStore):
                     "source_url": row[6],
                     "topic": row[7],
                     "date_published": row[8],
-                    "metadata": json.loads(row[9]) if row[9] else {},
+                    "metadata": loads_metadata(row[9]),
                     "keyword_score": round(normalized, 4),
                 }
             )
@@ -430,63 +470,29 @@ class PgVectorKBStore(BaseKBStore):
     def hybrid_search(
         self,
         query: str,
-        query_embedding: List[float],
+        query_embedding: Optional[List[float]],
         limit: int = 3,
         min_score: float = 0.0,
         filters: Optional[Dict[str, Any]] = None,
         semantic_weight: float = 0.7,
         keyword_weight: float = 0.3,
         exclude_flagged: bool = True,
+        fusion: str = "weighted",
+        keyword_results: Optional[List[Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
-        candidate_limit = limit * 3
-
-        semantic_results = self.semantic_search(
-            query_embedding=query_embedding,
-            limit=candidate_limit,
-            min_score=0.0,
-            filters=filters,
-            exclude_flagged=exclude_flagged,
-        )
-        bm25_results = self.keyword_search(
+        return self._fuse_hybrid(
             query=query,
-            limit=candidate_limit,
+            query_embedding=query_embedding,
+            limit=limit,
+            min_score=min_score,
             filters=filters,
+            semantic_weight=semantic_weight,
+            keyword_weight=keyword_weight,
             exclude_flagged=exclude_flagged,
+            fusion=fusion,
+            keyword_results=keyword_results,
         )
 
-        combined: Dict[str, Dict[str, Any]] = {}
-
-        for r in semantic_results:
-            cid = r["chunk_id"]
-            combined[cid] = r.copy()
-            combined[cid]["semantic_score"] = r["similarity_score"]
-            combined[cid]["keyword_score"] = 0.0
-
-        for r in bm25_results:
-            cid = r["chunk_id"]
-            if cid in combined:
-                combined[cid]["keyword_score"] = r["keyword_score"]
-            else:
-                combined[cid] = r.copy()
-                combined[cid]["semantic_score"] = 0.0
-                combined[cid]["keyword_score"] = r["keyword_score"]
-
-        hybrid: list[Dict[str, Any]] = []
-        for data in combined.values():
-            sem = data.get("semantic_score", 0.0)
-            kw = data.get("keyword_score", 0.0)
-            score = semantic_weight * sem + keyword_weight * kw
-            if score < min_score:
-                continue
-            data["similarity_score"] = round(score, 4)
-            data["hybrid_score"] = round(score, 4)
-            data["semantic_component"] = round(sem, 4)
-            data["keyword_component"] = round(kw, 4)
-            hybrid.append(data)
-
-        hybrid.sort(key=lambda x: x["hybrid_score"], reverse=True)
-        return hybrid[:limit]
-
     # ------------------------------------------------------------------
     # Admin operations
     # ------------------------------------------------------------------
@@ -497,7 +503,7 @@ class PgVectorKBStore(BaseKBStore):
         date_published, metadata, created_at, credibility_score,
         removal_flagged[, chunk_count]) into a KBDocument.
         """
-        metadata = json.loads(row[7]) if row[7] else {}
+        metadata = loads_metadata(row[7])
         raw_tags = metadata.get("tags") if isinstance(metadata, dict) else None
         tags = list(raw_tags) if isinstance(raw_tags, list) else []
         return KBDocument(
@@ -639,7 +645,7 @@ class PgVectorKBStore(BaseKBStore):
                     conn.rollback()
                     raise KBDocumentNotFoundError(f"kb document {doc_id} not found")
 
-                existing_metadata: Dict[str, Any] = json.loads(row[7]) if row[7] else {}
+                existing_metadata: Dict[str, Any] = loads_metadata(row[7])
 
                 new_content = row[1] if content is None else content
                 new_title = row[2] if title is None else title
@@ -7,6 +7,7 @@ SQLite + sqlite-vec (cosine similarity) + FTS5 (BM25 keyword search).
 
 import functools
 import json
+import re
 import sqlite3
 import threading
 from pathlib import Path
@@ -17,7 +18,12 @@ import sqlite_vec
 
 from ..exceptions import KBDocumentNotFoundError
 from ..models import KBDocument, KBDocumentListFilters
-from .kb_base import BaseKBStore
+from .kb_base import BaseKBStore, dumps_chunk_metadata, loads_metadata
+
+# Punctuation replaced with spaces before a query reaches FTS5 MATCH.
+_FTS5_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+# FTS5 boolean operators, dropped when they appear as standalone words.
+_FTS5_KEYWORDS = frozenset({"AND", "OR", "NOT", "NEAR"})
 
 
 def _locked(func):
@@ -64,6 +70,19 @@ class SQLiteKBStore(BaseKBStore):
         # Load sqlite-vec extension
         sqlite_vec.load(self.conn)
 
+        # WAL lets searches read while a populate run writes, and with
+        # synchronous=NORMAL commits no longer fsync a rollback journal.
+        # Skip for in-memory databases where journal_mode is irrelevant.
+        if db_path != ":memory:":
+            try:
+                journal_mode = self.conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            except sqlite3.DatabaseError:
+                # Some filesystems (e.g. NFS) reject WAL; fall back silently.
+                journal_mode = None
+            # NORMAL is only crash-safe in WAL mode; keep the default otherwise.
+            if journal_mode == "wal":
+                self.conn.execute("PRAGMA synchronous = NORMAL")
+
         # Initialize database schema
         self._init_schema()
 
@@ -180,54 +199,99 @@ class SQLiteKBStore(BaseKBStore):
             end_char: Ending character position in original document
             metadata: Additional metadata
         """
-        cursor = self.conn.cursor()
+        self.add_chunks(
+            [
+                {
+                    "chunk_id": chunk_id,
+                    "document_id": document_id,
+                    "content": content,
+                    "embedding": embedding,
+                    "chunk_index": chunk_index,
+                    "start_char": start_char,
+                    "end_char": end_char,
+                    "metadata": metadata,
+                }
+            ]
+        )
 
-        # Add chunk metadata
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO chunks
-            (id, document_id, content, chunk_index, start_char, end_char, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
+    @_locked
+    def add_chunks(self, chunks: List[Dict[str, Any]]) -> None:
+        """
+        Add several chunks in a single transaction.
+
+        Each entry holds the keyword arguments of :meth:`add_chunk`. All
+        rows are written with ``executemany`` and committed once, so bulk
+        ingestion pays for one commit instead of one per chunk.
+
+        Args:
+            chunks: Chunk dicts (``chunk_id``, ``document_id``, ``content``,
+                ``embedding``, ``chunk_index`` and the optional
+                ``start_char``, ``end_char``, ``metadata``)
+        """
+        if not chunks:
+            return
+
+        chunk_rows = [
             (
-                chunk_id,
-                document_id,
-                content,
-                chunk_index,
-                start_char,
-                end_char,
-                json.dumps(metadata) if metadata else None,
-            ),
-        )
+                c["chunk_id"],
+                c["document_id"],
+                c["content"],
+                c["chunk_index"],
+                c.get("start_char"),
+                c.get("end_char"),
+                metadata,
+            )
+            for c, metadata in zip(chunks, dumps_chunk_metadata(chunks))
+        ]
+        chunk_ids = [(c["chunk_id"],) for c in chunks]
 
-        # Add embedding vector.
-        # NOTE: sqlite-vec's vec0 virtual tables do NOT support
-        # `INSERT OR REPLACE` — attempting it raises
-        # `UNIQUE constraint failed on vec_chunks primary key`.
-        # Delete-then-insert is the supported upsert pattern.
-        embedding_bytes = np.array(embedding, dtype=np.float32).tobytes()
-        cursor.execute("DELETE FROM vec_chunks WHERE chunk_id = ?", (chunk_id,))
-        cursor.execute(
-            """
-            INSERT INTO vec_chunks (chunk_id, embedding)
-            VALUES (?, ?)
-        """,
-            (chunk_id, embedding_bytes),
-        )
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO chunks
+                (id, document_id, content, chunk_index, start_char, end_char, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                chunk_rows,
+            )
 
-        # Add to FTS5 index for keyword search.
-        # FTS5 external-content tables similarly don't support
-        # `INSERT OR REPLACE`, so mirror the delete-then-insert pattern.
-        cursor.execute("DELETE FROM fts_chunks WHERE chunk_id = ?", (chunk_id,))
-        cursor.execute(
-            """
-            INSERT INTO fts_chunks (chunk_id, content)
-            VALUES (?, ?)
-        """,
-            (chunk_id, content),
-        )
+            # Add embedding vectors.
+            # NOTE: sqlite-vec's vec0 virtual tables do NOT support
+            # `INSERT OR REPLACE` — attempting it raises
+            # `UNIQUE constraint failed on vec_chunks primary key`.
+            # Delete-then-insert is the supported upsert pattern.
+            cursor.executemany("DELETE FROM vec_chunks WHERE chunk_id = ?", chunk_ids)
+            cursor.executemany(
+                """
+                INSERT INTO vec_chunks (chunk_id, embedding)
+                VALUES (?, ?)
+            """,
+                [(c["chunk_id"], np.asarray(c["embedding"], dtype=np.float32).tobytes()) for c in chunks],
+            )
 
-        self.conn.commit()
+            # Add to FTS5 index for keyword search.
+            # FTS5 external-content tables similarly don't support
+            # `INSERT OR REPLACE`, so mirror the delete-then-insert pattern.
+            # chunk_id is UNINDEXED there, so delete the whole batch in one
+            # table scan rather than one scan per chunk.
+            cursor.execute(
+                "DELETE FROM fts_chunks WHERE chunk_id IN (SELECT value FROM json_each(?))",
+                (json.dumps([c["chunk_id"] for c in chunks]),),
+            )
+            cursor.executemany(
+                """
+                INSERT INTO fts_chunks (chunk_id, content)
+                VALUES (?, ?)
+            """,
+                [(c["chunk_id"], c["content"]) for c in chunks],
+            )
+
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
 
     @_locked
     def semantic_search(
@@ -242,7 +306,7 @@ class SQLiteKBStore(BaseKBStore):
         Perform semantic similarity search.
 
         Args:
-            query_embedding: Query vector embedding
+            query_embedding: Query vector embedding (list or float32 ndarray)
             limit: Maximum number of results
             min_score: Minimum similarity score (0-1)
             filters: Optional filters (source, topic, date_after, date_before)
@@ -274,7 +338,9 @@ class SQLiteKBStore(BaseKBStore):
             WHERE 1=1
         """
 
-        params = [np.array(query_embedding, dtype=np.float32).tobytes()]
+        # asarray is a no-op for a float32 ndarray, so callers that already
+        # hold one (e.g. from the embedding cache) skip the list conversion.
+        params = [np.asarray(query_embedding, dtype=np.float32).tobytes()]
 
         # Apply filters
         if filters:
@@ -329,7 +395,7 @@ class SQLiteKBStore(BaseKBStore):
                     "source_url": row[6],
                     "topic": row[7],
                     "date_published": row[8],
-                    "metadata": json.loads(row[9]) if row[9] else {},
+                    "metadata": loads_metadata(row[9]),
                     "similarity_score": round(similarity_score, 4),
                 }
             )
@@ -339,6 +405,7 @@ class SQLiteKBStore(BaseKBStore):
         return formatted_results
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _sanitize_fts5_query(query: str) -> str:
         """
         Sanitize a raw text query for use with FTS5 MATCH.
@@ -354,17 +421,17 @@ class SQLiteKBStore(BaseKBStore):
 
         Returns:
             Sanitized query safe for FTS5 MATCH, or empty string
-        """
-        import re
 
+        Results are memoised: hybrid search sanitizes the same query for
+        every call, and chat traffic repeats queries often.
+        """
         # Replace punctuation with spaces so tokens like "directly,"
         # or "don't" do not reach FTS5 as malformed barewords.
-        sanitized = re.sub(r"[^\w\s]", " ", query)
+        sanitized = _FTS5_PUNCTUATION_RE.sub(" ", query)
         # Collapse whitespace and strip
         words = sanitized.split()
         # Filter out FTS5 boolean keywords when used standalone
-        fts5_keywords = {"AND", "OR", "NOT", "NEAR"}
-        words = [w for w in words if w.upper() not in fts5_keywords]
+        words = [w for w in words if w.upper() not in _FTS5_KEYWORDS]
         # Join with OR so natural-language queries match any term
         # (FTS5 default is implicit AND which is too restrictive)
         return " OR ".join(words)
@@ -465,7 +532,7 @@ class SQLiteKBStore(BaseKBStore):
                     "source_url": row[6],
                     "topic": row[7],
                     "date_published": row[8],
-                    "metadata": json.loads(row[9]) if row[9] else {},
+                    "metadata": loads_metadata(row[9]),
                     "keyword_score": round(normalized_score, 4),
                 }
             )
@@ -476,93 +543,49 @@ class SQLiteKBStore(BaseKBStore):
     def hybrid_search(
         self,
         query: str,
-        query_embedding: List[float],
+        query_embedding: Optional[List[float]],
         limit: int = 3,
         min_score: float = 0.0,
         filters: Optional[Dict[str, Any]] = None,
         semantic_weight: float = 0.7,
         keyword_weight: float = 0.3,
         exclude_flagged: bool = True,
+        fusion: str = "weighted",
+        keyword_results: Optional[List[Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Perform combined search using semantic similarity and keyword matching.
 
         Args:
             query: Search query text
-            query_embedding: Query vector embedding
+            query_embedding: Query vector embedding, or None for keyword-only
             limit: Maximum number of results
             min_score: Minimum combined score (0-1)
             filters: Optional filters (source, topic, date_after, date_before)
             semantic_weight: Weight for semantic similarity (default 0.7)
             keyword_weight: Weight for keyword matching score (default 0.3)
             exclude_flagged: If True, exclude documents with removal_flagged=1
+            fusion: ``"weighted"`` (weighted score sum) or ``"rrf"``
+                (weighted Reciprocal Rank Fusion)
+            keyword_results: Prefetched ``keyword_search`` results to fuse
+                instead of searching again
 
         Returns:
             List of matching chunks with combined scores
         """
-        # Perform both searches with higher limits to ensure good candidate pool
-        candidate_limit = limit * 3
-
-        semantic_results = self.semantic_search(
-            query_embedding=query_embedding,
-            limit=candidate_limit,
-            min_score=0.0,
-            filters=filters,
-            exclude_flagged=exclude_flagged,
-        )
-
-        bm25_results = self.keyword_search(
+        return self._fuse_hybrid(
             query=query,
-            limit=candidate_limit,
+            query_embedding=query_embedding,
+            limit=limit,
+            min_score=min_score,
             filters=filters,
+            semantic_weight=semantic_weight,
+            keyword_weight=keyword_weight,
             exclude_flagged=exclude_flagged,
+            fusion=fusion,
+            keyword_results=keyword_results,
         )
 
-        # Combine results by chunk_id
-        combined = {}
-
-        # Add semantic results
-        for result in semantic_results:
-            chunk_id = result["chunk_id"]
-            combined[chunk_id] = result.copy()
-            combined[chunk_id]["semantic_score"] = result["similarity_score"]
-            combined[chunk_id]["keyword_score"] = 0.0  # Default if not found in keyword search
-
-        # Add/update with keyword results
-        for result in bm25_results:
-            chunk_id = result["chunk_id"]
-            if chunk_id in combined:
-                combined[chunk_id]["keyword_score"] = result["keyword_score"]
-            else:
-                combined[chunk_id] = result.copy()
-                combined[chunk_id]["semantic_score"] = 0.0  # Default if not found in semantic
-                combined[chunk_id]["keyword_score"] = result["keyword_score"]
-
-        # Calculate hybrid scores
-        hybrid_results = []
-        for _, data in combined.items():
-            semantic_score = data.get("semantic_score", 0.0)
-            keyword_score_val = data.get("keyword_score", 0.0)
-
-            # Combined score using weighted average
-            combined_score = (semantic_weight * semantic_score) + (keyword_weight * keyword_score_val)
-
-            # Skip if below minimum threshold
-            if combined_score < min_score:
-                continue
-
-            # Update result with scores
-            data["similarity_score"] = round(combined_score, 4)  # Main score for compatibility
-            data["hybrid_score"] = round(combined_score, 4)
-            data["semantic_component"] = round(semantic_score, 4)
-            data["keyword_component"] = round(keyword_score_val, 4)
-
-            hybrid_results.append(data)
-
-        # Sort by combined score and limit
-        hybrid_results.sort(key=lambda x: x["hybrid_score"], reverse=True)
-        return hybrid_results[:limit]
-
     @_locked
     def get_document(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -598,7 +621,7 @@ class SQLiteKBStore(BaseKBStore):
             "source_url": row[4],
             "topic": row[5],
             "date_published": row[6],
-            "metadata": json.loads(row[7]) if row[7] else {},
+            "metadata": loads_metadata(row[7]),
             "created_at": row[8],
             "credibility_score": float(row[9]) if row[9] is not None else 1.0,
             "removal_flagged": bool(row[10]) if row[10] is not None else False,
@@ -640,22 +663,14 @@ class SQLiteKBStore(BaseKBStore):
     def delete_document(self, doc_id: str) -> None:
         """Delete a document and all its chunks."""
         cursor = self.conn.cursor()
-
-        # Get chunk IDs to delete from vector table
-        cursor.execute("SELECT id FROM chunks WHERE document_id = ?", (doc_id,))
-        chunk_ids = [row[0] for row in cursor.fetchall()]
-
-        # Delete from vector table
-        for chunk_id in chunk_ids:
-            cursor.execute("DELETE FROM vec_chunks WHERE chunk_id = ?", (chunk_id,))
-
-        # Delete chunks
-        cursor.execute("DELETE FROM chunks WHERE document_id = ?", (doc_id,))
-
-        # Delete document
-        cursor.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
-
-        self.conn.commit()
+        cursor.execute("BEGIN")
+        try:
+            self._delete_chunks_for(cursor, doc_id)
+            cursor.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
 
     # ------------------------------------------------------------------
     # Admin operations
@@ -667,7 +682,7 @@ class SQLiteKBStore(BaseKBStore):
         date_published, metadata, created_at, credibility_score,
         removal_flagged[, chunk_count]) into a KBDocument.
         """
-        metadata = json.loads(row[7]) if row[7] else {}
+        metadata = loads_metadata(row[7])
         raw_tags = metadata.get("tags") if isinstance(metadata, dict) else None
         tags = list(raw_tags) if isinstance(raw_tags, list) else []
         # created_at comes back as a string from SQLite's TIMESTAMP DEFAULT
@@ -773,10 +788,17 @@ class SQLiteKBStore(BaseKBStore):
         fts_chunks. Caller owns the transaction.
         """
         cursor.execute("SELECT id FROM chunks WHERE document_id = ?", (doc_id,))
-        chunk_ids = [r[0] for r in cursor.fetchall()]
-        for chunk_id in chunk_ids:
-            cursor.execute("DELETE FROM vec_chunks WHERE chunk_id = ?", (chunk_id,))
-            cursor.execute("DELETE FROM fts_chunks WHERE chunk_id = ?", (chunk_id,))
+        chunk_ids = cursor.fetchall()
+        if not chunk_ids:
+            return
+        # vec0 looks chunk_id up by primary key, so per-id deletes are cheap.
+        cursor.executemany("DELETE FROM vec_chunks WHERE chunk_id = ?", chunk_ids)
+        # chunk_id is UNINDEXED in fts_chunks: every equality delete scans the
+        # whole FTS table, so remove the document's rows in a single pass.
+        cursor.execute(
+            "DELETE FROM fts_chunks WHERE chunk_id IN (SELECT id FROM chunks WHERE document_id = ?)",
+            (doc_id,),
+        )
         cursor.execute("DELETE FROM chunks WHERE document_id = ?", (doc_id,))
 
     @_locked
@@ -813,7 +835,7 @@ class SQLiteKBStore(BaseKBStore):
             if row is None:
                 raise KBDocumentNotFoundError(f"kb document {doc_id} not found")
 
-            existing_metadata: Dict[str, Any] = json.loads(row[7]) if row[7] else {}
+            existing_metadata: Dict[str, Any] = loads_metadata(row[7])
 
             # Compose the new column values; ``None`` == "don't touch".
             new_content = row[1] if content is None else content
@@ -898,20 +920,25 @@ class SQLiteKBStore(BaseKBStore):
         """Get database statistics."""
         cursor = self.conn.cursor()
 
-        cursor.execute("SELECT COUNT(*) FROM documents")
-        doc_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM chunks")
-        chunk_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM vec_chunks")
-        vector_count = cursor.fetchone()[0]
+        # One statement for all counters; page_count covers pages still in
+        # the WAL file, unlike stat() on the main database file.
+        cursor.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM documents),
+                (SELECT COUNT(*) FROM chunks),
+                (SELECT COUNT(*) FROM vec_chunks),
+                page_count * page_size
+            FROM pragma_page_count(), pragma_page_size()
+        """
+        )
+        doc_count, chunk_count, vector_count, db_size_bytes = cursor.fetchone()
 
         return {
             "documents": doc_count,
             "chunks": chunk_count,
             "vectors": vector_count,
-            "db_size_bytes": Path(self.db_path).stat().st_size if Path(self.db_path).exists() else 0,
+            "db_size_bytes": db_size_bytes,
         }
 
     @_locked
@@ -990,4 +1017,13 @@ class SQLiteKBStore(BaseKBStore):
     @_locked
     def close(self):
         """Close database connection."""
+        # Let SQLite refresh planner statistics for the tables this
+        # connection queried, so source/topic/date filters keep using
+        # their indexes as the knowledge base grows.
+        if self.db_path != ":memory:":
+            try:
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.DatabaseError:
+                # Read-only or locked databases cannot store statistics.
+                pass
         self.conn.close()
@@ -69,7 +69,8 @@ async def preprocess_node(state: ChatState, config: RunnableConfig) -> Dict[str,
         on_progress=on_progress,
     )
 
-    preprocessing_applied = len(processed) != len(messages) or processed != messages
-    metadata["preprocessing_applied"] = preprocessing_applied
+    # preprocess_messages hands back the input list untouched when no stage
+    # fired, so identity answers this without comparing every message.
+    metadata["preprocessing_applied"] = processed is not messages
 
     return {"messages": processed, "metadata": metadata}
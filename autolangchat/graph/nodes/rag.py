@@ -30,6 +30,39 @@ from ..state import ChatState
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Retrieval helpers
+# ---------------------------------------------------------------------------
+
+
+async def _embed_query(embedding_client: Any, chat_config: Any, query: str) -> Optional[List[float]]:
+    """Embed *query*, or return ``None`` when semantic matching is disabled."""
+    # Keyword-only configurations never use the query vector, so skip the
+    # embedding round trip entirely.
+    if chat_config.kb_semantic_weight <= 0:
+        return None
+    embedding: List[float] = await embedding_client.generate_embedding(
+        text=query,
+        model_id=chat_config.kb_embedding_model,
+    )
+    return embedding
+
+
+async def _keyword_candidates(kb_store: Any, chat_config: Any, query: str) -> List[Dict[str, Any]]:
+    """Run the hybrid search's keyword half in a worker thread.
+
+    Returns ``[]`` without querying when keyword matching is disabled.
+    """
+    if chat_config.kb_keyword_weight <= 0:
+        return []
+    return await asyncio.to_thread(
+        kb_store.keyword_search,
+        query=query,
+        limit=kb_store.hybrid_candidate_limit(chat_config.kb_top_k_results),
+        filters=None,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Formatting helpers (moved from websocket_handler)
 # ---------------------------------------------------------------------------
@@ -120,12 +153,20 @@ async def rag_node(state: ChatState, config: RunnableConfig) -> Dict[str, Any]:
                 kb_store = create_kb_store(chat_config)
                 _close_after = True
 
-            query_embedding = await embedding_client.generate_embedding(
-                text=user_query,
-                model_id=chat_config.kb_embedding_model,
+            # The keyword search needs no query vector, so run it in a worker
+            # thread while the query is embedded and hand its results to
+            # hybrid_search.  return_exceptions keeps both running to
+            # completion so the store is never closed under an in-flight search.
+            query_embedding, keyword_results = await asyncio.gather(
+                _embed_query(embedding_client, chat_config, user_query),
+                _keyword_candidates(kb_store, chat_config, user_query),
+                return_exceptions=True,
             )
-
             try:
+                for outcome in (query_embedding, keyword_results):
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+
                 results = await asyncio.to_thread(
                     kb_store.hybrid_search,
                     query=user_query,
@@ -135,6 +176,8 @@ async def rag_node(state: ChatState, config: RunnableConfig) -> Dict[str, Any]:
                     filters=None,
                     semantic_weight=chat_config.kb_semantic_weight,
                     keyword_weight=chat_config.kb_keyword_weight,
+                    fusion=chat_config.kb_fusion_method,
+                    keyword_results=keyword_results,
                 )
             finally:
                 if _close_after:
@@ -28,10 +28,11 @@ Usage (standalone)::
     print(len(generator.tools_desc["functions"]), "tools")
 """
 
+import functools
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
 
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
@@ -42,6 +43,14 @@ from ...exceptions import ToolsGenerationError
 logger = logging.getLogger(__name__)
 
 
+class _ToolState(NamedTuple):
+    """Everything ``ToolsGenerator`` derives from one parse of the OpenAPI spec."""
+
+    tools_desc: Dict[str, Any]
+    generated_tools: Dict[str, Any]
+    validators: Dict[str, Callable[[Dict[str, Any]], bool]]
+
+
 class ToolsGenerator:
     """Generates tool descriptions from FastAPI routes or OpenAPI specs for AI model consumption."""
 
@@ -67,8 +76,6 @@ class ToolsGenerator:
         self.app = app
         self.config = config or ChatConfig()
         self._openapi_schema = None
-        # Single source of truth: {func_name: {path, method, operation, function_desc}}
-        self._generated_tools: Optional[Dict[str, Any]] = None
         self._openapi_spec_source = openapi_spec
 
         # Validate initialization parameters
@@ -81,22 +88,45 @@ class ToolsGenerator:
         self.generate_tools_desc()
 
     def generate_tools_desc(self) -> Dict[str, Any]:
-        """Build and cache the OpenAPI-derived tool description schema.
+        """Return the cached OpenAPI-derived tool description schema.
 
-        Idempotent — returns the cached result on every call after the first.
-        Called automatically by ``__init__``; call again (or use
-        ``invalidate_cache()``) only if you need to pick up runtime route changes.
+        Idempotent — the schema is built once (eagerly, by ``__init__``) and
+        every later call returns the cached result. Use ``invalidate_cache()``
+        only if you need to pick up runtime route changes.
 
         Returns:
             Dict with ``{"type": "function", "functions": [...]}``, ready for
             direct use as the OpenAI tool-calling payload.
         """
-        if self._generated_tools is not None:
-            return self.tools_desc
+        return self._tool_state.tools_desc
+
+    @property
+    def tools_desc(self) -> Dict[str, Any]:
+        """OpenAI-style tool schema, computed from ``_generated_tools``."""
+        return self._tool_state.tools_desc
+
+    @property
+    def _generated_tools(self) -> Dict[str, Any]:
+        """Single source of truth: ``{func_name: {path, method, operation, function_desc}}``."""
+        return self._tool_state.generated_tools
 
+    @property
+    def _validators(self) -> Dict[str, Callable[[Dict[str, Any]], bool]]:
+        """Per-tool argument validators, compiled alongside ``_generated_tools``."""
+        return self._tool_state.validators
+
+    @functools.cached_property
+    def _tool_state(self) -> _ToolState:
+        """Parse the OpenAPI spec once into tool metadata, schema and validators.
+
+        Every public entry point (``generate_tools_desc``, ``tools_desc``,
+        ``get_tool_metadata``, ``validate_tool_call``, ...) reads from this
+        cached state, so none of them needs a prior warm-up call.
+        """
         try:
             self._openapi_schema = self._get_openapi_schema()
-            self._generated_tools = {}
+            generated_tools: Dict[str, Any] = {}
+            validators: Dict[str, Callable[[Dict[str, Any]], bool]] = {}
 
             for path, path_info in self._openapi_schema.get("paths", {}).items():
                 if self._should_exclude_path(path):
@@ -117,34 +147,32 @@ class ToolsGenerator:
                         continue
 
                     func_name = function_desc["name"]
-                    self._generated_tools[func_name] = {
+                    generated_tools[func_name] = {
                         "path": path,
                         "method": method.upper(),
                         "operation": operation,
                         "function_desc": function_desc,
                     }
+                    validators[func_name] = self._build_validator(func_name, function_desc["parameters"])
 
-            logger.info("Generated %d tool descriptions from OpenAPI spec", len(self._generated_tools))
-            return self.tools_desc
+            logger.info("Generated %d tool descriptions from OpenAPI spec", len(generated_tools))
+            tools_desc = {"type": "function", "functions": [t["function_desc"] for t in generated_tools.values()]}
+            return _ToolState(tools_desc=tools_desc, generated_tools=generated_tools, validators=validators)
 
         except Exception as e:
             logger.error(f"Failed to generate tools: {str(e)}")
             raise ToolsGenerationError(f"Tools generation failed: {str(e)}")
 
-    @property
-    def tools_desc(self) -> Dict[str, Any]:
-        """OpenAI-style tool schema, computed from ``_generated_tools``."""
-        generated = self._generated_tools or {}
-        return {"type": "function", "functions": [t["function_desc"] for t in generated.values()]}
-
     def invalidate_cache(self) -> None:
         """Invalidate all cached schema data and rebuild immediately.
 
         Use this when routes change at runtime (e.g. dynamic route registration)
-        to force the next ``generate_tools_desc()`` call to re-parse the spec.
+        to force the spec to be re-parsed, or after changing ``config`` so the
+        cached ``api_base_url`` is resolved again.
         Immediately rebuilds so ``tools_desc`` is never transiently None.
         """
-        self._generated_tools = None
+        self.__dict__.pop("_tool_state", None)
+        self.__dict__.pop("api_base_url", None)
         self._openapi_schema = None
         self.generate_tools_desc()
         logger.info("Tool schema invalidated and rebuilt")
@@ -210,6 +238,11 @@ class ToolsGenerator:
             raise ToolsGenerationError(f"Failed to open OpenAPI spec file {spec_path}: {e}")
 
     def get_api_base_url(self) -> str:
+        """Return the API base URL for internal API calls (see ``api_base_url``)."""
+        return self.api_base_url
+
+    @functools.cached_property
+    def api_base_url(self) -> str:
         """
         Determine API base URL for internal API calls.
 
@@ -217,6 +250,9 @@ class ToolsGenerator:
         1. config.api_base_url — when explicitly set (not the default), this always wins.
         2. OpenAPI spec servers[0].url — used when the config has only the default value.
         3. config.api_base_url default (http://localhost:8000) — final fallback.
+
+        Resolved once and cached; call ``invalidate_cache()`` after changing
+        ``config`` to pick up a new value.
         """
         _DEFAULT_API_BASE_URL = "http://localhost:8000"
 
@@ -524,35 +560,49 @@ class ToolsGenerator:
     def validate_tool_call(self, function_name: str, arguments: Dict[str, Any]) -> bool:
         """Validate tool call arguments against the function schema"""
 
-        tool_metadata = self.get_tool_metadata(function_name)
-        if not tool_metadata:
+        validator = self._validators.get(function_name)
+        if validator is None:
             return False
 
-        function_desc = tool_metadata["function_desc"]
-        parameters_schema = function_desc.get("parameters", {})
-
         try:
+            return validator(arguments)
+        except Exception as e:
+            logger.error(f"Error validating tool call: {str(e)}")
+            return False
+
+    def _build_validator(self, function_name: str, parameters_schema: Dict) -> Callable[[Dict[str, Any]], bool]:
+        """Compile a validator for one tool's parameters schema.
+
+        The required set and per-property expected types are extracted once,
+        so each ``validate_tool_call`` is a set check plus one type check per
+        supplied argument instead of a re-walk of the schema.
+        """
+        required_params = tuple(parameters_schema.get("required", []))
+        required = frozenset(required_params)
+        expected_types = {
+            name: prop["type"]
+            for name, prop in parameters_schema.get("properties", {}).items()
+            if isinstance(prop, dict) and prop.get("type")
+        }
+        validate_type = self._validate_parameter_type
+
+        def _validator(arguments: Dict[str, Any]) -> bool:
             # Check required parameters
-            required_params = parameters_schema.get("required", [])
-            for required_param in required_params:
-                if required_param not in arguments:
-                    logger.warning(f"Missing required parameter '{required_param}' for tool '{function_name}'")
-                    return False
+            if not required.issubset(arguments.keys()):
+                missing = next(p for p in required_params if p not in arguments)
+                logger.warning(f"Missing required parameter '{missing}' for tool '{function_name}'")
+                return False
 
             # Validate parameter types (basic validation)
-            properties = parameters_schema.get("properties", {})
             for param_name, param_value in arguments.items():
-                if param_name in properties:
-                    expected_type = properties[param_name].get("type")
-                    if expected_type and not self._validate_parameter_type(param_value, expected_type):
-                        logger.warning(f"Invalid type for parameter '{param_name}' in tool '{function_name}'")
-                        return False
+                expected_type = expected_types.get(param_name)
+                if expected_type and not validate_type(param_value, expected_type):
+                    logger.warning(f"Invalid type for parameter '{param_name}' in tool '{function_name}'")
+                    return False
 
             return True
 
-        except Exception as e:
-            logger.error(f"Error validating tool call: {str(e)}")
-            return False
+        return _validator
 
     def _validate_parameter_type(self, value: Any, expected_type: str) -> bool:
         """Validate parameter type"""
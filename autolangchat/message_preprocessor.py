@@ -410,7 +410,9 @@ class MessagePreprocessor:
                 to tighten all limits so that remaining oversized content
                 is truncated further.
         Returns:
-            Preprocessed message list, ready for LLM formatting.
+            Preprocessed message list, ready for LLM formatting.  When no
+            stage changes anything, *messages* itself is returned, so
+            callers can detect a no-op with an identity check.
         """
         if threshold_factor <= 0:
             raise ValueError(f"threshold_factor must be positive, got {threshold_factor}")
@@ -424,22 +426,29 @@ class MessagePreprocessor:
                 break
         try:
             f = threshold_factor
+            sizes: Optional[List[int]] = self._message_sizes(messages)
 
             # Stage 1: Single-message truncation -- any message exceeding
             # single_msg_length_threshold is truncated/summarized.
-            messages = await self._truncate_oversized_messages(
+            stage1 = await self._truncate_oversized_messages(
                 messages,
                 threshold=int(self.single_msg_threshold * f),
                 target=int(self.single_msg_target * f),
+                sizes=sizes,
             )
+            if stage1 is not messages:
+                messages, sizes = stage1, None
 
             # Stage 2: History-total truncation -- if combined size exceeds
-            # history_total_length_threshold, progressively reduce.
+            # history_total_length_threshold, progressively reduce.  When
+            # Stage 1 changed nothing its measurements are reused, so small
+            # conversations cost a single size pass overall.
             messages = await self._truncate_history_total(
                 messages,
                 total_threshold=int(self.history_total_threshold * f),
                 msg_threshold=int(self.history_msg_threshold * f),
                 msg_target=int(self.history_msg_target * f),
+                sizes=sizes,
             )
 
             return messages
@@ -460,6 +469,7 @@ class MessagePreprocessor:
         msg_target: Optional[int] = None,
         max_recursion: Optional[int] = None,
         depth: int = 0,
+        sizes: Optional[List[int]] = None,
     ) -> List[Dict[str, Any]]:
         """Stage 2: Progressive history-total truncation.
 
@@ -497,6 +507,10 @@ class MessagePreprocessor:
             msg_target: Override for ``self.history_msg_target``.
             max_recursion: Override for ``self.max_truncation_recursion``.
             depth: Current recursion depth (0 on the initial call).
+            sizes: Per-message ``get_content_size`` values aligned with
+                *messages*.  Measured once on the initial call and kept in
+                sync by each stage, so the budget checks never re-walk the
+                message contents.
 
         Returns:
             Messages after history-level reduction.
@@ -510,14 +524,19 @@ class MessagePreprocessor:
         if max_recursion is None:
             max_recursion = self.max_truncation_recursion
 
-        total_size = self._total_messages_size(messages)
+        if sizes is None:
+            sizes = self._message_sizes(messages)
+        total_size = sum(sizes)
         if total_size <= total_threshold:
-            logger.debug(
-                "History truncation depth=%d: total size %s chars within threshold %s chars",
-                depth,
-                f"{total_size:,}",
-                f"{total_threshold:,}",
-            )
+            # Hit on every request; skip the eager f-string formatting
+            # unless debug logging is actually on.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "History truncation depth=%d: total size %s chars within threshold %s chars",
+                    depth,
+                    f"{total_size:,}",
+                    f"{total_threshold:,}",
+                )
             return messages
 
         logger.info(
@@ -544,8 +563,9 @@ class MessagePreprocessor:
                 indices=middle_indices,
                 msg_threshold=msg_threshold,
                 msg_target=msg_target,
+                sizes=sizes,
             )
-            total_size = self._total_messages_size(messages)
+            total_size = sum(sizes)
             if total_size <= total_threshold:
                 logger.info(
                     "History truncation resolved after Stage 2.1: %s chars",
@@ -561,7 +581,9 @@ class MessagePreprocessor:
                     len(middle_indices),
                 )
                 messages = self._wipe_middle_zone(messages, middle_indices)
-                total_size = self._total_messages_size(messages)
+                wiped = set(middle_indices)
+                sizes = [size for i, size in enumerate(sizes) if i not in wiped]
+                total_size = sum(sizes)
                 if total_size <= total_threshold:
                     logger.info(
                         "History truncation resolved after Stage 2.2: %s chars",
@@ -572,15 +594,17 @@ class MessagePreprocessor:
         # ── Stage 2.3: Truncate ALL user/tool messages ───────────────
         # Unlike previous steps that targeted only specific zones,
         # this step targets every user and tool message in the entire
-        # conversation that exceeds msg_threshold.
+        # conversation that exceeds msg_threshold.  The size check runs
+        # first so the role predicates only see messages that could change.
         all_user_tool_indices = [
             i
-            for i in range(len(messages))
-            if isinstance(messages[i], dict)
+            for i, size in enumerate(sizes)
+            if size > msg_threshold
+            and isinstance(messages[i], dict)
             and (messages[i].get("role") in ("user", "tool") or is_tool_message(messages[i]))
         ]
         logger.info(
-            "History truncation Stage 2.3: truncating %d user/tool " "messages (all zones)",
+            "History truncation Stage 2.3: truncating %d oversized user/tool " "messages (all zones)",
             len(all_user_tool_indices),
         )
         messages = await self._history_step_truncate_zone(
@@ -588,8 +612,9 @@ class MessagePreprocessor:
             indices=all_user_tool_indices,
             msg_threshold=msg_threshold,
             msg_target=msg_target,
+            sizes=sizes,
         )
-        total_size = self._total_messages_size(messages)
+        total_size = sum(sizes)
         if total_size <= total_threshold:
             logger.info(
                 "History truncation resolved after Stage 2.3: %s chars",
@@ -616,6 +641,7 @@ class MessagePreprocessor:
                 msg_target=halved_msg_target,
                 max_recursion=max_recursion,
                 depth=depth + 1,
+                sizes=sizes,
             )
 
         logger.error(
@@ -650,27 +676,22 @@ class MessagePreprocessor:
         if not messages:
             return {"protected": [], "middle": []}
 
-        protected: set = set()
         n = len(messages)
 
         # System prompt
-        if isinstance(messages[0], dict) and messages[0].get("role") == "system":
-            protected.add(0)
+        middle_start = 1 if isinstance(messages[0], dict) and messages[0].get("role") == "system" else 0
 
-        # Find last real user message index
-        last_user_idx: Optional[int] = None
+        # The trailing block is contiguous, so a reverse scan that stops at
+        # the last real user message is all that is needed to split zones.
+        trailing_start = n
         for i in range(n - 1, -1, -1):
             if is_user_message(messages[i]):
-                last_user_idx = i
+                trailing_start = i
                 break
 
-        if last_user_idx is not None:
-            # Protect last user message + everything after it
-            for i in range(last_user_idx, n):
-                protected.add(i)
-
-        middle = sorted(i for i in range(n) if i not in protected)
-        return {"protected": sorted(protected), "middle": middle}
+        middle_end = max(trailing_start, middle_start)
+        protected = list(range(middle_start)) + list(range(middle_end, n))
+        return {"protected": protected, "middle": list(range(middle_start, middle_end))}
 
     # ── Truncation helpers for history steps ──────────────────────────
 
@@ -681,6 +702,7 @@ class MessagePreprocessor:
         indices: List[int],
         msg_threshold: int,
         msg_target: int,
+        sizes: Optional[List[int]] = None,
     ) -> List[Dict[str, Any]]:
         """Truncate messages at *indices* that exceed *msg_threshold*.
 
@@ -688,15 +710,22 @@ class MessagePreprocessor:
         AI-summarized; otherwise plain-text truncation is used.
 
         Returns a **new** list (same length) with affected messages
-        replaced by their truncated versions.
+        replaced by their truncated versions, or *messages* itself when
+        none of *indices* exceeds *msg_threshold*.  When *sizes* is given
+        it is used for the threshold checks and updated in place for
+        every message that gets truncated.
         """
+        if sizes is None:
+            sizes = self._message_sizes(messages)
+        if not any(sizes[idx] > msg_threshold for idx in indices):
+            return messages
         result = list(messages)  # shallow copy
         truncated_count = 0
         for idx in indices:
             msg = result[idx]
             if not isinstance(msg, dict):
                 continue
-            size = get_content_size(msg)
+            size = sizes[idx]
             if size <= msg_threshold:
                 continue
             result[idx] = await self._truncate_single_message(
@@ -705,6 +734,7 @@ class MessagePreprocessor:
             )
             truncated_count += 1
             new_size = get_content_size(result[idx])
+            sizes[idx] = new_size
             logger.info(
                 "History truncation: index %d (%s) %s → %s chars",
                 idx,
@@ -724,9 +754,9 @@ class MessagePreprocessor:
         return [msg for i, msg in enumerate(messages) if i not in removed]
 
     @staticmethod
-    def _total_messages_size(messages: List[Dict[str, Any]]) -> int:
-        """Sum of ``get_content_size`` across all messages."""
-        return sum(get_content_size(m) for m in messages)
+    def _message_sizes(messages: List[Dict[str, Any]]) -> List[int]:
+        """``get_content_size`` of every message, in order."""
+        return [get_content_size(m) for m in messages]
 
     # ------------------------------------------------------------------
     # AI-based single-message summarization
@@ -976,6 +1006,7 @@ class MessagePreprocessor:
         *,
         threshold: Optional[int] = None,
         target: Optional[int] = None,
+        sizes: Optional[List[int]] = None,
     ) -> List[Dict[str, Any]]:
         """Stage 1: Truncate any individual message whose content exceeds the threshold.
 
@@ -992,36 +1023,43 @@ class MessagePreprocessor:
             messages: Raw conversation messages.
             threshold: Override for ``self.single_msg_threshold``.
             target: Override for ``self.single_msg_target``.
+            sizes: Precomputed ``get_content_size`` values aligned with
+                *messages*; measured here when omitted.
 
         Returns:
-            Message list with oversized messages truncated.
+            Message list with oversized messages truncated, or *messages*
+            itself when none exceed the threshold.
         """
         effective_threshold = threshold if threshold is not None else self.single_msg_threshold
         effective_target = target if target is not None else self.single_msg_target
 
-        logger.debug(
-            "Looking for oversized messages exceeding %s chars for Stage 1 truncation",
-            f"{effective_threshold:,}",
-        )
-        result: List[Dict[str, Any]] = []
-
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Looking for oversized messages exceeding %s chars for Stage 1 truncation",
+                f"{effective_threshold:,}",
+            )
         # Pre-scan to count how many messages need truncation so
         # progress messages can show "1/N" style counters.
-        oversized_indices = [
-            i for i, msg in enumerate(messages) if isinstance(msg, dict) and get_content_size(msg) > effective_threshold
-        ]
-        total_to_truncate = len(oversized_indices)
+        if sizes is None:
+            sizes = self._message_sizes(messages)
+        total_to_truncate = sum(
+            1 for msg, size in zip(messages, sizes) if isinstance(msg, dict) and size > effective_threshold
+        )
+        if not total_to_truncate:
+            logger.debug("Oversized message truncation finished: no messages exceeded threshold")
+            return messages
+
+        result: List[Dict[str, Any]] = []
         truncated_count = 0
 
         if total_to_truncate and self.ai_enabled:
             await self._notify("Summarizing conversation...")
 
-        for msg in messages:
+        for msg, size in zip(messages, sizes):
             if not isinstance(msg, dict):
                 result.append(msg)
                 continue
 
-            size = get_content_size(msg)
             if size <= effective_threshold:
                 result.append(msg)
                 continue
@@ -1050,14 +1088,10 @@ class MessagePreprocessor:
             )
             result.append(truncated_msg)
 
-        if truncated_count:
-            logger.info(
-                "Oversized message truncation finished: %d message(s) truncated",
-                truncated_count,
-            )
-        else:
-            logger.debug("Oversized message truncation finished: no messages exceeded threshold")
-
+        logger.info(
+            "Oversized message truncation finished: %d message(s) truncated",
+            truncated_count,
+        )
         return result
 
     async def _truncate_single_message(
@@ -1177,18 +1211,17 @@ class MessagePreprocessor:
         new_tool_results = list(tool_results_list)  # shallow copy
         any_changed = False
 
+        # Proportional share of the budget, computed once per entry in
+        # integer arithmetic and reused for both counting and truncation.
+        shares = [max(target * size // total_payload_size, 1) for _, _, _, size in entries]
+
         # Count entries that actually need truncation for progress reporting
-        entries_needing_truncation = [
-            e for e in entries if e[1] and e[3] > max(int(target * (e[3] / total_payload_size)), 1)
-        ]
-        total_to_truncate = len(entries_needing_truncation)
+        total_to_truncate = sum(1 for e, share in zip(entries, shares) if e[1] and e[3] > share)
         truncation_idx = 0
 
-        for j, payload_key, payload_str, size in entries:
+        for (j, payload_key, payload_str, size), share in zip(entries, shares):
             if not payload_key or size == 0:
                 continue
-            # Proportional share of the budget
-            share = max(int(target * (size / total_payload_size)), 1)
             if size > share:
                 truncation_idx += 1
                 tool_call_id = tool_calls_list[j].get("id", f"tool_{j}") if j < len(tool_calls_list) else f"tool_{j}"
@@ -1211,14 +1244,12 @@ class MessagePreprocessor:
             # so keeping it in sync avoids exposing the original untruncated data.
             # NOTE: get_content_size() intentionally ignores `content` for tool
             # messages — this step is for fidelity, not for sizing math.
+            # Payload keys come from the measurement pass above, so entries
+            # are not re-stringified just to rediscover where they live.
             new_content = json.dumps(
                 [
-                    (
-                        tr.get(_get_tool_result_payload(tr)[0])
-                        if isinstance(tr, dict) and _get_tool_result_payload(tr)[0]
-                        else (tr.get("error") if isinstance(tr, dict) else None)
-                    )
-                    for tr in new_tool_results
+                    tr.get(payload_key) if payload_key else (tr.get("error") if isinstance(tr, dict) else None)
+                    for tr, (_, payload_key, _, _) in zip(new_tool_results, entries)
                 ]
             )
             return {**msg, "content": new_content, "tool_results": new_tool_results}
@@ -1270,7 +1301,7 @@ class MessagePreprocessor:
                 continue
 
             # Proportional share of the target budget
-            item_target = max(MIN_PROPORTIONAL_BUDGET, int(target * item_size / total_size))
+            item_target = max(MIN_PROPORTIONAL_BUDGET, target * item_size // total_size)
 
             if not isinstance(item, dict) or item_size <= item_target:
                 new_content.append(item)
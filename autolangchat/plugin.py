@@ -660,10 +660,12 @@ class AutoLangChatPlugin:
                         vector_db = create_kb_store(self.config)
                         local_store = vector_db
 
-                    # Generate embedding for the query
-                    query_embedding = await self.embedding_client.generate_embedding(
-                        text=request.query, model_id=self.config.kb_embedding_model
-                    )
+                    # Generate embedding for the query (not needed for keyword-only search)
+                    query_embedding = None
+                    if self.config.kb_semantic_weight > 0:
+                        query_embedding = await self.embedding_client.generate_embedding(
+                            text=request.query, model_id=self.config.kb_embedding_model
+                        )
 
                     # Build filters dict
                     filters = None
@@ -678,8 +680,10 @@ class AutoLangChatPlugin:
                         if request.filters.date_before:
                             filters["date_before"] = request.filters.date_before
 
-                    # Perform search using configured weights
-                    results = vector_db.hybrid_search(
+                    # Perform search using configured weights; the store is
+                    # synchronous, so keep it off the event loop.
+                    results = await asyncio.to_thread(
+                        vector_db.hybrid_search,
                         query=request.query,
                         query_embedding=query_embedding,
                         limit=request.limit,
@@ -687,6 +691,7 @@ class AutoLangChatPlugin:
                         filters=filters,
                         semantic_weight=self.config.kb_semantic_weight,
                         keyword_weight=self.config.kb_keyword_weight,
+                        fusion=self.config.kb_fusion_method,
                     )
 
                     # Format results
@@ -18,7 +18,7 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any, List
+from typing import Any, Dict, List
 
 import boto3
 
@@ -26,6 +26,9 @@ from ..exceptions import BedrockClientError
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on ``texts`` per Cohere embed request on Bedrock.
+COHERE_MAX_TEXTS = 96
+
 
 class BedrockEmbeddingClient:
     """AWS Bedrock client for embedding generation only.
@@ -100,15 +103,7 @@ class BedrockEmbeddingClient:
             else:
                 raise BedrockClientError(f"Unsupported embedding model: {model_id}")
 
-            await self._handle_rate_limiting()
-
-            response = self._client.invoke_model(
-                modelId=model_id,
-                body=body,
-                contentType="application/json",
-                accept="application/json",
-            )
-            response_body = json.loads(response["body"].read())
+            response_body = await self._invoke_model(model_id, body)
 
             if model_id.startswith("amazon.titan-embed"):
                 embedding = response_body.get("embedding")
@@ -129,27 +124,104 @@ class BedrockEmbeddingClient:
             logger.error("Failed to generate embedding: %s", exc)
             raise BedrockClientError(f"Embedding generation failed: {exc}") from exc
 
+    async def _invoke_model(self, model_id: str, body: str) -> Dict[str, Any]:
+        """Rate-limit, call ``invoke_model`` and return the decoded JSON body."""
+        await self._handle_rate_limiting()
+
+        response = self._client.invoke_model(
+            modelId=model_id,
+            body=body,
+            contentType="application/json",
+            accept="application/json",
+        )
+        response_body: Dict[str, Any] = json.loads(response["body"].read())
+        return response_body
+
+    async def _generate_cohere_embeddings(self, texts: List[str], model_id: str) -> List[List[float]]:
+        """Embed up to ``COHERE_MAX_TEXTS`` texts with a single Cohere request.
+
+        Raises:
+            BedrockClientError: If the call fails or returns the wrong number
+                of embeddings.
+        """
+        try:
+            body = json.dumps({"texts": texts, "input_type": "search_document"})
+            response_body = await self._invoke_model(model_id, body)
+        except Exception as exc:
+            raise BedrockClientError(f"Embedding generation failed: {exc}") from exc
+
+        embeddings = response_body.get("embeddings") or []
+        if len(embeddings) != len(texts) or not all(embeddings):
+            raise BedrockClientError(f"Expected {len(texts)} embeddings from model, got {len(embeddings)}")
+        return embeddings
+
+    async def _generate_embeddings_concurrently(
+        self,
+        texts: List[str],
+        model_id: str,
+        max_concurrency: int,
+        offset: int = 0,
+    ) -> List[List[float]]:
+        """Embed *texts* one request each, with at most *max_concurrency* in flight.
+
+        A semaphore keeps a sliding window of requests open, so one slow call
+        delays only its own slot rather than the start of the next batch.
+        Texts that fail are replaced by a zero vector; *offset* is only used
+        to report their position in the caller's list.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _embed(index: int, text: str) -> List[float]:
+            async with semaphore:
+                try:
+                    return await self.generate_embedding(text, model_id)
+                except Exception as exc:
+                    logger.error("Failed to embed text %d: %s", offset + index, exc)
+                    return [0.0] * 1536  # Titan v1 fallback dimension
+
+        return list(await asyncio.gather(*(_embed(i, text) for i, text in enumerate(texts))))
+
     async def generate_embeddings_batch(
         self,
         texts: List[str],
         model_id: str = "amazon.titan-embed-text-v1",
         batch_size: int = 25,
     ) -> List[List[float]]:
-        """Generate embeddings for multiple texts with concurrent batching.
+        """Generate embeddings for multiple texts with bounded concurrency.
 
         Args:
             texts: Input texts.
             model_id: Bedrock embedding model identifier.
-            batch_size: Number of texts to embed concurrently per batch.
+            batch_size: Texts per request for Cohere models; maximum number of
+                concurrent single-text requests for Titan models.
 
         Returns:
             List of embedding vectors in the same order as ``texts``.
 
         Note:
+            Cohere models embed each batch in a single request (capped at
+            ``COHERE_MAX_TEXTS``); Titan models send one request per text,
+            keeping up to ``batch_size`` in flight at once.
             AWS Bedrock has rate limits. The default ``batch_size=25`` is
             conservative; increase it only if your quota allows.
+
+        Raises:
+            ValueError: If ``batch_size`` is less than 1.
         """
-        embeddings: List[List[float]] = []
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        embeddings: List[List[float]]
+        if not model_id.startswith("cohere.embed"):
+            # Titan takes one text per request: fan out under a concurrency cap.
+            logger.info("Embedding %d text(s), up to %d concurrent request(s)", len(texts), batch_size)
+            embeddings = await self._generate_embeddings_concurrently(texts, model_id, batch_size)
+            logger.info("Generated %d embeddings total", len(embeddings))
+            return embeddings
+
+        # Cohere accepts many texts per request, so each batch is one round trip.
+        embeddings = []
+        batch_size = min(batch_size, COHERE_MAX_TEXTS)
 
         for i in range(0, len(texts), batch_size):
             batch = texts[i : i + batch_size]
@@ -157,15 +229,11 @@ class BedrockEmbeddingClient:
             total_batches = (len(texts) - 1) // batch_size + 1
             logger.info("Processing embedding batch %d/%d", batch_num, total_batches)
 
-            tasks = [self.generate_embedding(text, model_id) for text in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for j, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error("Failed to embed text %d: %s", i + j, result)
-                    embeddings.append([0.0] * 1536)  # Titan v1 fallback dimension
-                else:
-                    embeddings.append(result)
+            try:
+                embeddings.extend(await self._generate_cohere_embeddings(batch, model_id))
+            except BedrockClientError as exc:
+                logger.warning("Batched embedding request failed, retrying per text: %s", exc)
+                embeddings.extend(await self._generate_embeddings_concurrently(batch, model_id, batch_size, offset=i))
 
         logger.info("Generated %d embeddings total", len(embeddings))
         return embeddings
@@ -16,6 +16,8 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -234,32 +236,57 @@ class EmbeddingGenerator:
         return hashlib.sha256(content.encode()).hexdigest()
 
     def _load_from_cache(self, cache_key: str) -> Optional[List[float]]:
-        """Load embedding from cache."""
+        """Load embedding from cache.
+
+        Entries are stored as float32 ``.npy`` files; ``.json`` files written
+        by earlier versions are still read.
+        """
         if not self.cache_dir:
             return None
 
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        cache_file = self.cache_dir / f"{cache_key}.npy"
         if cache_file.exists():
             try:
-                with open(cache_file, "r") as f:
+                embedding: List[float] = np.load(cache_file).tolist()
+                return embedding
+            except Exception as e:
+                logger.warning(f"Failed to load from cache: {e}")
+            return None
+
+        legacy_file = self.cache_dir / f"{cache_key}.json"
+        if legacy_file.exists():
+            try:
+                with open(legacy_file, "r") as f:
                     data = json.load(f)
-                return data["embedding"]
+                legacy: List[float] = np.asarray(data["embedding"], dtype=np.float32).tolist()
+                return legacy
             except Exception as e:
                 logger.warning(f"Failed to load from cache: {e}")
 
         return None
 
-    def _save_to_cache(self, cache_key: str, embedding: List[float]):
-        """Save embedding to cache."""
+    def _save_to_cache(self, cache_key: str, embedding: List[float]) -> List[float]:
+        """Save embedding to cache as a float32 ``.npy`` file.
+
+        float32 matches the precision the KB stores vectors at and is read
+        back without a JSON parse.
+
+        Returns:
+            The embedding rounded to float32 when caching is enabled, so a
+            fresh result matches what a later cache hit returns; otherwise
+            ``embedding`` unchanged.
+        """
         if not self.cache_dir:
-            return
+            return embedding
 
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        vector = np.asarray(embedding, dtype=np.float32)
+        cache_file = self.cache_dir / f"{cache_key}.npy"
         try:
-            with open(cache_file, "w") as f:
-                json.dump({"embedding": embedding}, f)
+            np.save(cache_file, vector)
         except Exception as e:
             logger.warning(f"Failed to save to cache: {e}")
+        rounded: List[float] = vector.tolist()
+        return rounded
 
     def generate_embedding(self, text: str) -> List[float]:
         """
@@ -275,7 +302,7 @@ class EmbeddingGenerator:
         cache_key = self._get_cache_key(text)
         cached = self._load_from_cache(cache_key)
         if cached:
-            logger.debug(f"Cache hit for text: {text[:50]}...")
+            logger.debug("Cache hit for text: %.50s...", text)
             return cached
 
         # Generate embedding using Bedrock (async operation)
@@ -296,9 +323,7 @@ class EmbeddingGenerator:
             embedding = loop.run_until_complete(self.bedrock_client.generate_embedding(text, self.model))
 
         # Save to cache
-        self._save_to_cache(cache_key, embedding)
-
-        return embedding
+        return self._save_to_cache(cache_key, embedding)
 
     def generate_embeddings_batch(self, texts: List[str], show_progress: bool = True) -> List[List[float]]:
         """
@@ -355,8 +380,7 @@ class EmbeddingGenerator:
                 # Cache and add to results
                 for text, embedding, idx in zip(texts_to_generate, new_embeddings, indices_to_generate):
                     cache_key = self._get_cache_key(text)
-                    self._save_to_cache(cache_key, embedding)
-                    batch_embeddings.append((idx, embedding))
+                    batch_embeddings.append((idx, self._save_to_cache(cache_key, embedding)))
 
             # Sort by original index and extract embeddings
             batch_embeddings.sort(key=lambda x: x[0])
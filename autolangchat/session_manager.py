@@ -16,7 +16,7 @@ from .exceptions import SessionError
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatSession:
     """Represents a chat session (live WebSocket connection context).
 
@@ -8,6 +8,7 @@ import json
 import logging
 import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
@@ -48,6 +49,24 @@ logger = logging.getLogger(__name__)
 # the WebSocket path when the same guard already exists over REST.
 _CONVERSATION_LIST_MAX_LIMIT = 200
 
+# Most successful verifications cached at once; the oldest is evicted beyond it.
+_AUTH_VERIFICATION_CACHE_MAX_SIZE = 1024
+
+# auth_type -> (fields that must be non-empty strings, error sent otherwise).
+# Checked before any Credentials/verification work, so malformed auth
+# messages never cost a round-trip to auth_verification_endpoint.
+_OAUTH2_REQUIRED_FIELDS = (
+    ("client_id", "client_secret", "token_url"),
+    "client_id, client_secret, and token_url required for OAuth2",
+)
+_REQUIRED_AUTH_FIELDS: Dict[str, tuple[tuple[str, ...], str]] = {
+    "bearer_token": (("token",), "Bearer token required"),
+    "basic_auth": (("username", "password"), "Username and password required for basic auth"),
+    "api_key": (("api_key",), "API key required"),
+    "oauth2": _OAUTH2_REQUIRED_FIELDS,
+    "oauth2_client_credentials": _OAUTH2_REQUIRED_FIELDS,
+}
+
 
 def _get_sso_session_store_class():
     """Lazy import of SSOSessionStore (requires PyJWT)."""
@@ -104,11 +123,31 @@ class WebSocketChatHandler:
         # mid-flight; each task removes itself on completion.
         self._background_tasks: set = set()
 
-        self.http_client = httpx.AsyncClient(timeout=config.timeout)
+        # Created on first use by the ``http_client`` property.
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+        # sha256(credentials) -> (monotonic expiry, user_info) for successful
+        # remote verifications; only used when auth_verification_cache_ttl > 0.
+        self._auth_verification_cache: OrderedDict[str, tuple[float, Optional[Dict[str, Any]]]] = OrderedDict()
 
         self._total_messages_handled = 0
         self._total_errors = 0
 
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client for auth verification, OAuth2 and feedback enrichment.
+
+        Built lazily: loading the SSL context costs tens of milliseconds, and
+        handlers that never verify credentials never need it.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=self.config.timeout)
+        return self._http_client
+
+    @http_client.setter
+    def http_client(self, client: httpx.AsyncClient) -> None:
+        self._http_client = client
+
     async def handle_connection(
         self,
         websocket: WebSocket,
@@ -511,7 +550,9 @@ class WebSocketChatHandler:
                     "ts": datetime.now().astimezone().isoformat(),
                 },
             )
-            logger.debug(f"Chat graph response ({len(content):,} chars): {content[:100]}")
+            # %.100s truncates at format time, and only when DEBUG is enabled,
+            # so long responses are never sliced just to be discarded.
+            logger.debug("Chat graph response (%d chars): %.100s", len(content), content)
 
             response_metadata = final_response.get("metadata", {}).copy()
             response_metadata["model_id"] = effective_config.model_id
@@ -1555,6 +1596,70 @@ class WebSocketChatHandler:
             },
         )
 
+    @staticmethod
+    def _verification_cache_key(credentials: Credentials, verification_url: str) -> str:
+        """Digest of everything the verification endpoint gets to see.
+
+        Hashed so the cache never holds raw secrets as dictionary keys.
+        """
+        material = json.dumps(
+            [
+                verification_url,
+                credentials.get_auth_type_string(),
+                credentials.bearer_token,
+                credentials.username,
+                credentials.password,
+                credentials.client_id,
+                credentials.client_secret,
+                credentials.api_key,
+                credentials.api_key_header,
+                credentials.token_url,
+                credentials.scope,
+                sorted(credentials.custom_headers.items()),
+            ]
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    async def _verify_credentials_cached(
+        self, auth_handler: AuthenticationHandler, credentials: Credentials, verification_url: str
+    ) -> tuple[bool, str, Optional[Dict[str, Any]]]:
+        """``verify_credentials_remote`` with an optional TTL cache of successes.
+
+        With ``auth_verification_cache_ttl`` set, a client reconnecting with
+        the same credentials reuses the earlier result instead of another
+        HTTP round-trip. Failures always go back to the endpoint.
+        """
+        ttl = self.config.auth_verification_cache_ttl
+        if not ttl:
+            return await auth_handler.verify_credentials_remote(verification_url, http_client=self.http_client)
+
+        cache = self._auth_verification_cache
+        key = self._verification_cache_key(credentials, verification_url)
+        now = time.monotonic()
+        cached = cache.get(key)
+        if cached is not None:
+            if cached[0] > now:
+                user_info = dict(cached[1]) if cached[1] is not None else None
+                return True, "Credentials verified successfully (cached)", user_info
+            del cache[key]
+
+        is_valid, message, user_info = await auth_handler.verify_credentials_remote(
+            verification_url, http_client=self.http_client
+        )
+        if is_valid:
+            # Every entry shares one TTL, so insertion order is expiry order:
+            # expired entries and, at the cap, the oldest live ones sit at the
+            # front.  A concurrent verification may have added ``key`` already;
+            # re-insert it at the end to keep that order.
+            cache.pop(key, None)
+            while cache:
+                oldest_expiry = next(iter(cache.values()))[0]
+                if len(cache) < _AUTH_VERIFICATION_CACHE_MAX_SIZE and oldest_expiry > now:
+                    break
+                cache.popitem(last=False)
+            cache[key] = (now + ttl, dict(user_info) if user_info is not None else None)
+        return is_valid, message, user_info
+
     async def _handle_auth_message(self, websocket: WebSocket, data: Dict[str, Any]):
         """Handle authentication message from client"""
 
@@ -1567,25 +1672,26 @@ class WebSocketChatHandler:
             # Extract credentials from message
             auth_type = data.get("auth_type", "bearer_token").lower()
 
+            required = _REQUIRED_AUTH_FIELDS.get(auth_type)
+            if required is not None:
+                fields, error_message = required
+                if not all(isinstance(data.get(f), str) and data[f] for f in fields):
+                    await self._send_error(websocket, error_message)
+                    return
+
             # Create credentials based on auth type
             credentials = None
 
             if auth_type == "bearer_token":
-                token = data.get("token")
-                if not token:
-                    await self._send_error(websocket, "Bearer token required")
-                    return
+                token = data["token"]
                 credentials = Credentials(
                     auth_type=AuthType.BEARER_TOKEN,
                     bearer_token=token,
                 )
 
             elif auth_type == "basic_auth":
-                username = data.get("username")
-                password = data.get("password")
-                if not username or not password:
-                    await self._send_error(websocket, "Username and password required for basic auth")
-                    return
+                username = data["username"]
+                password = data["password"]
                 credentials = Credentials(
                     auth_type=AuthType.BASIC_AUTH,
                     username=username,
@@ -1593,11 +1699,8 @@ class WebSocketChatHandler:
                 )
 
             elif auth_type == "api_key":
-                api_key = data.get("api_key")
+                api_key = data["api_key"]
                 api_key_header = data.get("api_key_header", "X-API-Key")
-                if not api_key:
-                    await self._send_error(websocket, "API key required")
-                    return
                 credentials = Credentials(
                     auth_type=AuthType.API_KEY,
                     api_key=api_key,
@@ -1605,15 +1708,11 @@ class WebSocketChatHandler:
                 )
 
             elif auth_type == "oauth2" or auth_type == "oauth2_client_credentials":
-                client_id = data.get("client_id")
-                client_secret = data.get("client_secret")
-                token_url = data.get("token_url")
+                client_id = data["client_id"]
+                client_secret = data["client_secret"]
+                token_url = data["token_url"]
                 scope = data.get("scope")
 
-                if not client_id or not client_secret or not token_url:
-                    await self._send_error(websocket, "client_id, client_secret, and token_url required for OAuth2")
-                    return
-
                 credentials = Credentials(
                     auth_type=AuthType.OAUTH2_CLIENT_CREDENTIALS,
                     client_id=client_id,
@@ -1673,8 +1772,8 @@ class WebSocketChatHandler:
                 if verification_url.startswith("/"):
                     verification_url = f"{self.app_base_url}{verification_url}"
                 logger.info(f"Verifying credentials for session {session.session_id} against {verification_url}")
-                is_valid, message, user_info = await auth_handler.verify_credentials_remote(
-                    verification_url, http_client=self.http_client
+                is_valid, message, user_info = await self._verify_credentials_cached(
+                    auth_handler, credentials, verification_url
                 )
                 # Log only user_id and keys to avoid PII in logs
                 user_id_from_info = user_info.get("user_id") if user_info else None
@@ -2087,8 +2186,9 @@ class WebSocketChatHandler:
     async def shutdown(self):
         """Shutdown the WebSocket handler"""
 
-        # Close HTTP client
-        await self.http_client.aclose()
+        # Close HTTP client (only if one was ever created)
+        if self._http_client is not None:
+            await self._http_client.aclose()
 
         # Shutdown session manager
         await self.session_manager.shutdown()
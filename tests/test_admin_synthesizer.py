@@ -167,7 +167,7 @@ async def test_embed_and_add_chunks_calls_generate_embeddings_batch():
     await synth._embed_and_add_chunks("doc-1", long_content, kb_store, bedrock_client)
 
     bedrock_client.generate_embeddings_batch.assert_awaited_once()
-    kb_store.add_chunk.assert_called()
+    kb_store.add_chunks.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,116 @@
+"""Tests for ``BedrockEmbeddingClient`` request batching."""
+
+import asyncio
+import io
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from autolangchat.rag.bedrock_embeddings import COHERE_MAX_TEXTS, BedrockEmbeddingClient
+
+
+def _response(payload: dict) -> dict:
+    return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+
+@pytest.fixture
+def client():
+    with patch.object(BedrockEmbeddingClient, "_initialize_client"):
+        embedder = BedrockEmbeddingClient(config=MagicMock())
+    embedder._client = MagicMock()
+    embedder._handle_rate_limiting = AsyncMock()
+    return embedder
+
+
+async def test_cohere_batch_uses_one_request_per_batch(client):
+    def invoke_model(modelId, body, **kwargs):
+        texts = json.loads(body)["texts"]
+        return _response({"embeddings": [[float(len(t))] for t in texts]})
+
+    client._client.invoke_model.side_effect = invoke_model
+    texts = ["a", "bb", "ccc"]
+
+    result = await client.generate_embeddings_batch(texts, model_id="cohere.embed-english-v3")
+
+    assert result == [[1.0], [2.0], [3.0]]
+    assert client._client.invoke_model.call_count == 1
+
+
+async def test_cohere_batch_size_is_capped(client):
+    client._client.invoke_model.side_effect = lambda modelId, body, **kw: _response(
+        {"embeddings": [[0.5]] * len(json.loads(body)["texts"])}
+    )
+    texts = ["t"] * (COHERE_MAX_TEXTS + 1)
+
+    result = await client.generate_embeddings_batch(texts, model_id="cohere.embed-english-v3", batch_size=500)
+
+    assert len(result) == len(texts)
+    assert client._client.invoke_model.call_count == 2
+
+
+async def test_cohere_batch_falls_back_to_per_text_on_short_response(client):
+    def invoke_model(modelId, body, **kwargs):
+        texts = json.loads(body)["texts"]
+        if len(texts) > 1:
+            return _response({"embeddings": [[1.0]]})
+        return _response({"embeddings": [[2.0]]})
+
+    client._client.invoke_model.side_effect = invoke_model
+
+    result = await client.generate_embeddings_batch(["a", "b"], model_id="cohere.embed-english-v3")
+
+    assert result == [[2.0], [2.0]]
+    assert client._client.invoke_model.call_count == 3
+
+
+async def test_titan_batch_sends_one_request_per_text(client):
+    client._client.invoke_model.side_effect = lambda modelId, body, **kw: _response({"embedding": [0.1]})
+
+    result = await client.generate_embeddings_batch(["a", "b", "c"], model_id="amazon.titan-embed-text-v1")
+
+    assert result == [[0.1]] * 3
+    assert client._client.invoke_model.call_count == 3
+
+
+async def test_titan_batch_caps_in_flight_requests(client):
+    in_flight = 0
+    peak = 0
+
+    async def generate_embedding(text, model_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return [float(text)]
+
+    client.generate_embedding = generate_embedding
+    texts = [str(i) for i in range(10)]
+
+    result = await client.generate_embeddings_batch(texts, batch_size=3)
+
+    assert result == [[float(i)] for i in range(10)]
+    assert peak == 3
+
+
+async def test_titan_batch_substitutes_zero_vector_for_failures(client):
+    async def generate_embedding(text, model_id):
+        if text == "bad":
+            raise RuntimeError("boom")
+        return [1.0]
+
+    client.generate_embedding = generate_embedding
+
+    result = await client.generate_embeddings_batch(["ok", "bad", "ok"])
+
+    assert result[0] == result[2] == [1.0]
+    assert result[1] == [0.0] * 1536
+
+
+@pytest.mark.parametrize("model_id", ["amazon.titan-embed-text-v1", "cohere.embed-english-v3"])
+async def test_batch_rejects_non_positive_batch_size(client, model_id):
+    with pytest.raises(ValueError, match="batch_size"):
+        await client.generate_embeddings_batch(["a"], model_id=model_id, batch_size=0)
+
+    client._client.invoke_model.assert_not_called()
@@ -22,9 +22,12 @@ from autolangchat.config import ChatConfig
 from autolangchat.graph.nodes.preprocess import preprocess_node
 from autolangchat.graph.nodes.rag import rag_node
 
+# Built once per module; each test derives its variant via ``model_copy``.
+_BASE_CONFIG = ChatConfig()
+
 
 def _config(**overrides):
-    return ChatConfig().model_copy(update=overrides)
+    return _BASE_CONFIG.model_copy(update=overrides)
 
 
 # ---------------------------------------------------------------------------
@@ -93,6 +96,12 @@ class _DummyKBStore:
             ]
         )
 
+        self.keyword_search = MagicMock(return_value=[])
+
+    @staticmethod
+    def hybrid_candidate_limit(limit):
+        return limit * 3
+
     def close(self):
         pass
 
@@ -171,5 +180,5 @@ class TestRagNodeKbParamOverrides:
         await rag_node(_rag_state(), config)
 
         _, call_kwargs = kb_store.hybrid_search.call_args
-        assert call_kwargs["limit"] == ChatConfig().kb_top_k_results
-        assert call_kwargs["min_score"] == ChatConfig().kb_similarity_threshold
+        assert call_kwargs["limit"] == _BASE_CONFIG.kb_top_k_results
+        assert call_kwargs["min_score"] == _BASE_CONFIG.kb_similarity_threshold
@@ -0,0 +1,52 @@
+"""Tests for the on-disk embedding cache in ``EmbeddingGenerator``."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from autolangchat.rag.embedding_pipeline import EmbeddingGenerator
+
+
+@pytest.fixture
+def generator(tmp_path):
+    return EmbeddingGenerator(bedrock_client=MagicMock(), cache_dir=str(tmp_path))
+
+
+def test_cache_round_trip_uses_float32_npy(generator, tmp_path):
+    key = generator._get_cache_key("hello")
+    generator._save_to_cache(key, [0.25, -0.5, 1.0])
+
+    cache_file = tmp_path / f"{key}.npy"
+    assert cache_file.exists()
+    assert np.load(cache_file).dtype == np.float32
+    assert generator._load_from_cache(key) == [0.25, -0.5, 1.0]
+
+
+def test_legacy_json_entries_are_still_read(generator, tmp_path):
+    key = generator._get_cache_key("legacy")
+    (tmp_path / f"{key}.json").write_text(json.dumps({"embedding": [0.1, 0.2]}))
+
+    assert generator._load_from_cache(key) == np.asarray([0.1, 0.2], dtype=np.float32).tolist()
+
+
+def test_cache_miss_returns_none(generator):
+    assert generator._load_from_cache(generator._get_cache_key("missing")) is None
+
+
+def test_cache_hit_skips_bedrock(generator):
+    generator._save_to_cache(generator._get_cache_key("cached"), [0.5])
+
+    assert generator.generate_embedding("cached") == [0.5]
+    generator.bedrock_client.generate_embedding.assert_not_called()
+
+
+def test_cache_miss_and_hit_return_the_same_vector(generator):
+    generator.bedrock_client.generate_embedding = AsyncMock(return_value=[0.1, 0.2, 0.3])
+
+    fresh = generator.generate_embedding("text")
+    cached = generator.generate_embedding("text")
+
+    assert fresh == cached == np.asarray([0.1, 0.2, 0.3], dtype=np.float32).tolist()
+    generator.bedrock_client.generate_embedding.assert_awaited_once()
@@ -30,6 +30,8 @@ def _load_kb_sqlite_module():
         pass
 
     kb_base_mod.BaseKBStore = BaseKBStore
+    kb_base_mod.loads_metadata = lambda raw: {}
+    kb_base_mod.dumps_chunk_metadata = lambda chunks: [None] * len(chunks)
 
     original_modules = {
         name: sys.modules.get(name)
@@ -83,3 +85,13 @@ def test_sanitize_fts5_query_drops_boolean_keywords():
     sanitized = SQLiteKBStore._sanitize_fts5_query(query)
 
     assert sanitized == "alpha OR beta OR gamma OR delta OR epsilon"
+
+
+def test_sanitize_fts5_query_is_memoised():
+    SQLiteKBStore._sanitize_fts5_query.cache_clear()
+
+    first = SQLiteKBStore._sanitize_fts5_query("status codes?")
+    second = SQLiteKBStore._sanitize_fts5_query("status codes?")
+
+    assert first == second == "status OR codes"
+    assert SQLiteKBStore._sanitize_fts5_query.cache_info().hits == 1
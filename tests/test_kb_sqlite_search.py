@@ -0,0 +1,202 @@
+"""Search-path tests for ``SQLiteKBStore``.
+
+Exercises ``semantic_search``, ``keyword_search`` and ``hybrid_search``
+against a real on-disk SQLite database (sqlite-vec + FTS5), so the SQL and
+result formatting are covered without mocking.
+"""
+
+import numpy as np
+import pytest
+
+from ._autolangchat_imports import load_module
+
+exceptions_mod = load_module("autolangchat.exceptions", "exceptions.py")
+models_mod = load_module(
+    "autolangchat.models",
+    "models.py",
+    extra_modules={"autolangchat.exceptions": exceptions_mod},
+)
+kb_base_mod = load_module(
+    "autolangchat.db.kb_base",
+    "db/kb_base.py",
+    extra_modules={
+        "autolangchat.exceptions": exceptions_mod,
+        "autolangchat.models": models_mod,
+    },
+)
+kb_sqlite_mod = load_module(
+    "autolangchat.db.kb_sqlite",
+    "db/kb_sqlite.py",
+    extra_modules={
+        "autolangchat.exceptions": exceptions_mod,
+        "autolangchat.models": models_mod,
+        "autolangchat.db.kb_base": kb_base_mod,
+    },
+)
+
+SQLiteKBStore = kb_sqlite_mod.SQLiteKBStore
+
+DIM = 1536
+
+# Orthogonal unit embeddings, allocated once; rows are passed to the store as-is.
+_UNITS = np.eye(5, DIM, dtype=np.float32)
+
+
+def _unit(index: int) -> list:
+    return _UNITS[index].tolist()
+
+
+@pytest.fixture(scope="module")
+def seeded_store(tmp_path_factory):
+    """Five single-chunk documents, all mentioning 'widget', with orthogonal embeddings.
+
+    Module-scoped and shared by the read-only search tests below so the
+    database is opened and seeded once per module.
+    """
+    kb = SQLiteKBStore(db_path=str(tmp_path_factory.mktemp("kb") / "search_kb.db"))
+    for i in range(5):
+        doc_id = f"doc{i}"
+        kb.add_document(doc_id=doc_id, content=f"widget manual part {i}", title=f"Doc {i}", source="docs")
+        kb.add_chunk(
+            chunk_id=f"{doc_id}_c0",
+            document_id=doc_id,
+            content=f"widget manual part {i}",
+            embedding=_UNITS[i],
+            chunk_index=0,
+        )
+    yield kb
+    kb.close()
+
+
+def test_keyword_search_respects_limit(seeded_store):
+    results = seeded_store.keyword_search("widget", limit=2)
+    assert len(results) == 2
+    assert all("keyword_score" in r for r in results)
+
+
+def test_keyword_search_negative_limit_is_unbounded(seeded_store):
+    # SQLite reads LIMIT -1 as "no limit"; the fetch must not undo that.
+    assert len(seeded_store.keyword_search("widget", limit=-1)) == 5
+
+
+def test_keyword_search_empty_query_returns_nothing(seeded_store):
+    assert seeded_store.keyword_search("?!", limit=3) == []
+
+
+def test_semantic_search_respects_limit_and_orders_by_similarity(seeded_store):
+    results = seeded_store.semantic_search(_unit(3), limit=2)
+    assert len(results) == 2
+    assert results[0]["chunk_id"] == "doc3_c0"
+    assert results[0]["similarity_score"] == pytest.approx(1.0)
+
+
+def test_hybrid_search_respects_limit(seeded_store):
+    results = seeded_store.hybrid_search("widget", _unit(1), limit=3)
+    assert len(results) == 3
+    assert results[0]["chunk_id"] == "doc1_c0"
+    assert results[0]["hybrid_score"] >= results[-1]["hybrid_score"]
+
+
+def test_hybrid_search_multi_matches_individual_calls(seeded_store):
+    pairs = [(0.9, 0.1), (0.7, 0.3), (0.2, 0.8)]
+    batched = seeded_store.hybrid_search_multi("widget", _unit(2), pairs, limit=3)
+
+    assert len(batched) == len(pairs)
+    for (sem, kw), results in zip(pairs, batched):
+        expected = seeded_store.hybrid_search("widget", _unit(2), limit=3, semantic_weight=sem, keyword_weight=kw)
+        assert results == expected
+
+
+def test_hybrid_search_rrf_scores_by_rank(seeded_store):
+    results = seeded_store.hybrid_search(
+        "widget", _unit(4), limit=3, semantic_weight=1.0, keyword_weight=0.0, fusion="rrf"
+    )
+
+    assert len(results) == 3
+    assert results[0]["chunk_id"] == "doc4_c0"
+    # Rank 1 in the only weighted list normalises to exactly 1.0.
+    assert results[0]["hybrid_score"] == pytest.approx(1.0)
+    assert results[0]["hybrid_score"] > results[1]["hybrid_score"] > results[2]["hybrid_score"]
+
+
+def test_hybrid_search_rejects_unknown_fusion(seeded_store):
+    with pytest.raises(ValueError):
+        seeded_store.hybrid_search("widget", _unit(0), fusion="max")
+
+
+def test_hybrid_search_without_embedding_is_keyword_only(seeded_store):
+    results = seeded_store.hybrid_search("widget", None, limit=3, semantic_weight=0.0, keyword_weight=1.0)
+
+    assert len(results) == 3
+    assert all(r["semantic_component"] == 0.0 for r in results)
+    assert all(r["hybrid_score"] == r["keyword_component"] for r in results)
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [(None, {}), ("", {}), ('{"tags": ["a"]}', {"tags": ["a"]}), ('{"score": NaN}', None)],
+)
+def test_loads_metadata(raw, expected):
+    result = kb_base_mod.loads_metadata(raw)
+    if expected is None:
+        assert result["score"] != result["score"]  # NaN survives via the json fallback
+    else:
+        assert result == expected
+
+
+def test_hybrid_search_reuses_prefetched_keyword_results(seeded_store):
+    prefetched = seeded_store.keyword_search("widget", limit=seeded_store.hybrid_candidate_limit(3))
+
+    assert seeded_store.hybrid_search("widget", _unit(1), limit=3, keyword_results=prefetched) == (
+        seeded_store.hybrid_search("widget", _unit(1), limit=3)
+    )
+    # An empty prefetch means no keyword matches: only semantic scores remain.
+    keyword_free = seeded_store.hybrid_search("widget", _unit(1), limit=3, keyword_results=[])
+    assert all(r["keyword_component"] == 0.0 for r in keyword_free)
+
+
+def test_semantic_search_accepts_float32_ndarray(seeded_store):
+    as_list = seeded_store.semantic_search(_unit(2), limit=2)
+    as_array = seeded_store.semantic_search(np.asarray(_unit(2), dtype=np.float32), limit=2)
+
+    assert as_array == as_list
+
+
+def test_hybrid_search_zero_keyword_weight_skips_keyword_search(seeded_store, monkeypatch):
+    def _fail(*args, **kwargs):
+        raise AssertionError("keyword search should be skipped")
+
+    monkeypatch.setattr(seeded_store, "keyword_search", _fail)
+    results = seeded_store.hybrid_search("widget", _unit(3), limit=2, semantic_weight=1.0, keyword_weight=0.0)
+
+    assert results[0]["chunk_id"] == "doc3_c0"
+    assert results[0]["hybrid_score"] == pytest.approx(1.0)
+
+
+def test_top_hybrid_results_matches_a_stable_sort():
+    pool = [
+        (score, {"chunk_id": f"c{i}", "semantic_score": score, "keyword_score": 0.0})
+        for i, score in enumerate([0.2, 0.9, 0.5, 0.9, 0.1])
+    ]
+
+    top = kb_base_mod.BaseKBStore._top_hybrid_results(pool, limit=3)
+
+    assert [r["chunk_id"] for r in top] == ["c1", "c3", "c2"]  # tie keeps candidate order
+    assert [r["hybrid_score"] for r in top] == [0.9, 0.9, 0.5]
+
+
+def test_dumps_chunk_metadata_encodes_shared_dict_once():
+    shared = {"document_id": "d"}
+    chunks = [
+        {"metadata": shared},
+        {"metadata": shared},
+        {"metadata": None},
+        {"metadata": {}},
+        {},
+        {"metadata": {"n": 1}},
+    ]
+
+    encoded = kb_base_mod.dumps_chunk_metadata(chunks)
+
+    assert encoded == ['{"document_id": "d"}', '{"document_id": "d"}', None, None, None, '{"n": 1}']
+    assert encoded[0] is encoded[1]
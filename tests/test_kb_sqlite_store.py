@@ -0,0 +1,145 @@
+"""Write-path tests for ``SQLiteKBStore`` against a real SQLite database."""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+from ._autolangchat_imports import load_module
+
+exceptions_mod = load_module("autolangchat.exceptions", "exceptions.py")
+models_mod = load_module(
+    "autolangchat.models",
+    "models.py",
+    extra_modules={"autolangchat.exceptions": exceptions_mod},
+)
+kb_base_mod = load_module(
+    "autolangchat.db.kb_base",
+    "db/kb_base.py",
+    extra_modules={
+        "autolangchat.exceptions": exceptions_mod,
+        "autolangchat.models": models_mod,
+    },
+)
+kb_sqlite_mod = load_module(
+    "autolangchat.db.kb_sqlite",
+    "db/kb_sqlite.py",
+    extra_modules={
+        "autolangchat.exceptions": exceptions_mod,
+        "autolangchat.models": models_mod,
+        "autolangchat.db.kb_base": kb_base_mod,
+    },
+)
+
+SQLiteKBStore = kb_sqlite_mod.SQLiteKBStore
+
+DIM = 1536
+
+_UNITS = np.eye(3, DIM, dtype=np.float32)
+
+
+def _chunk(doc_id: str, index: int, **overrides) -> dict:
+    chunk = {
+        "chunk_id": f"{doc_id}_{index}",
+        "document_id": doc_id,
+        "content": f"gadget chunk {index}",
+        "embedding": _UNITS[index],
+        "chunk_index": index,
+    }
+    chunk.update(overrides)
+    return chunk
+
+
+@pytest.fixture(scope="module")
+def _memory_store():
+    """One in-memory store per module so the schema DDL runs once."""
+    kb = SQLiteKBStore(db_path=":memory:")
+    yield kb
+    kb.close()
+
+
+@pytest.fixture
+def store(_memory_store):
+    """The shared store, emptied and re-seeded with document "doc"."""
+    with _memory_store.conn:
+        _memory_store.conn.executescript(
+            "DELETE FROM fts_chunks; DELETE FROM vec_chunks; DELETE FROM chunks; DELETE FROM documents;"
+        )
+    _memory_store.add_document(doc_id="doc", content="gadget manual", title="Doc", source="docs")
+    return _memory_store
+
+
+def _count(store, table: str) -> int:
+    return store.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_add_chunks_writes_all_indexes(store):
+    store.add_chunks([_chunk("doc", i, metadata={"n": i}) for i in range(3)])
+
+    assert _count(store, "chunks") == _count(store, "vec_chunks") == _count(store, "fts_chunks") == 3
+    assert [r["chunk_id"] for r in store.semantic_search(_chunk("doc", 2)["embedding"], limit=1)] == ["doc_2"]
+    assert len(store.keyword_search("gadget", limit=5)) == 3
+
+
+def test_add_chunks_replaces_existing_chunks(store):
+    store.add_chunks([_chunk("doc", 0), _chunk("doc", 1)])
+    store.add_chunks([_chunk("doc", 0, content="replaced text")])
+
+    assert _count(store, "vec_chunks") == _count(store, "fts_chunks") == 2
+    assert store.keyword_search("replaced", limit=5)[0]["chunk_id"] == "doc_0"
+
+
+def test_add_chunks_rolls_back_the_whole_batch(store):
+    bad = _chunk("doc", 1, embedding=[0.0] * 3)  # wrong dimension for vec0
+
+    with pytest.raises(sqlite3.OperationalError, match="Dimension mismatch"):
+        store.add_chunks([_chunk("doc", 0), bad])
+
+    assert _count(store, "chunks") == 0
+    store.add_chunk(**_chunk("doc", 0))  # connection is usable afterwards
+    assert _count(store, "chunks") == 1
+
+
+def test_file_database_uses_wal(tmp_path):
+    kb = SQLiteKBStore(db_path=str(tmp_path / "store_kb.db"))
+    try:
+        assert kb.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert kb.conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    finally:
+        kb.close()
+
+
+def test_get_stats_reports_counts_and_size(store):
+    store.add_chunks([_chunk("doc", i) for i in range(3)])
+
+    stats = store.get_stats()
+
+    assert (stats["documents"], stats["chunks"], stats["vectors"]) == (1, 3, 3)
+    assert stats["db_size_bytes"] > 0
+
+
+def test_delete_document_clears_all_indexes(store):
+    store.add_document(doc_id="other", content="other manual", title="Other", source="docs")
+    store.add_chunks([_chunk("doc", 0), _chunk("doc", 1), _chunk("other", 2)])
+
+    store.delete_document("doc")
+
+    assert _count(store, "documents") == 1
+    assert _count(store, "chunks") == _count(store, "vec_chunks") == _count(store, "fts_chunks") == 1
+    assert [r["chunk_id"] for r in store.keyword_search("gadget", limit=5)] == ["other_2"]
+
+
+def test_close_records_planner_statistics(tmp_path):
+    db_path = tmp_path / "store_kb.db"
+    kb = SQLiteKBStore(db_path=str(db_path))
+    kb.add_document(doc_id="doc", content="gadget manual", title="Doc", source="docs")
+    kb.add_chunks([_chunk("doc", i) for i in range(3)])
+    kb.semantic_search(_UNITS[0], limit=2, filters={"source": "docs"})
+
+    kb.close()
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()[0] == 1
+    finally:
+        conn.close()
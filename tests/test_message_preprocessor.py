@@ -0,0 +1,132 @@
+"""Direct tests for ``MessagePreprocessor`` truncation internals."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from autolangchat import message_preprocessor
+from autolangchat.message_preprocessor import MessagePreprocessor, get_content_size
+
+
+def _preprocessor(**overrides) -> MessagePreprocessor:
+    params = {
+        "single_msg_threshold": 1_000,
+        "single_msg_target": 800,
+        "history_msg_threshold": 30,
+        "history_msg_target": 20,
+    }
+    params.update(overrides)
+    return MessagePreprocessor(**params)
+
+
+def _history() -> list:
+    return [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": "a" * 200},
+        {"role": "assistant", "content": "b" * 200},
+        {"role": "tool", "content": "", "tool_results": [{"result": "c" * 200}]},
+        {"role": "user", "content": "latest question"},
+    ]
+
+
+@pytest.fixture
+def count_size_calls(monkeypatch):
+    calls = []
+    original = message_preprocessor.get_content_size
+
+    def counting(msg):
+        calls.append(msg)
+        return original(msg)
+
+    monkeypatch.setattr(message_preprocessor, "get_content_size", counting)
+    return calls
+
+
+async def test_history_within_budget_measures_each_message_once(count_size_calls):
+    messages = _history()
+
+    result = await _preprocessor()._truncate_history_total(messages, total_threshold=10_000)
+
+    assert result is messages
+    assert len(count_size_calls) == len(messages)
+
+
+async def test_history_truncation_keeps_sizes_in_sync(count_size_calls):
+    messages = _history()
+
+    result = await _preprocessor()._truncate_history_total(messages, total_threshold=400, max_recursion=0)
+
+    assert sum(get_content_size(m) for m in result) <= 400
+    # One measurement per message up front, plus one per truncated message.
+    truncated = sum(1 for before, after in zip(messages, result) if before is not after)
+    assert len(count_size_calls) == len(messages) + truncated
+
+
+async def test_small_conversation_is_measured_once(count_size_calls):
+    messages = _history()
+
+    result = await _preprocessor().preprocess_messages(messages)
+
+    assert result is messages
+    assert len(count_size_calls) == len(messages)
+
+
+_SYS = {"role": "system", "content": "s"}
+_USER = {"role": "user", "content": "u"}
+_AI = {"role": "assistant", "content": "a"}
+_TOOL = {"role": "tool", "content": "t"}
+
+
+@pytest.mark.parametrize(
+    "messages, protected, middle",
+    [
+        ([], [], []),
+        ([_SYS, _USER, _AI, _TOOL, _USER, _AI, _TOOL, _TOOL], [0, 4, 5, 6, 7], [1, 2, 3]),
+        ([_USER, _AI, _TOOL], [0, 1, 2], []),
+        ([_SYS, _AI, _TOOL], [0], [1, 2]),
+        ([_AI, _USER], [1], [0]),
+    ],
+)
+def test_detect_zones(messages, protected, middle):
+    assert MessagePreprocessor._detect_zones(messages) == {"protected": protected, "middle": middle}
+
+
+async def test_tool_results_share_the_target_proportionally():
+    msg = {
+        "role": "tool",
+        "content": "",
+        "tool_calls": [{"id": "big"}, {"id": "small"}],
+        "tool_results": [{"result": "x" * 3_000}, {"result": "y" * 1_000}],
+    }
+
+    result = await _preprocessor()._truncate_single_message(msg, 400)
+
+    big, small = (len(tr["result"]) for tr in result["tool_results"])
+    assert big <= 300 and small <= 100
+    assert big > small
+    assert msg["tool_results"][0]["result"] == "x" * 3_000  # input left untouched
+
+
+async def test_tool_content_mirror_matches_truncated_results():
+    msg = {
+        "role": "tool",
+        "content": "",
+        "tool_results": [{"result": "x" * 2_000}, {"content": {"k": "v"}}, {"error": "boom"}, "not-a-dict"],
+    }
+
+    result = await _preprocessor()._truncate_single_message(msg, 500)
+
+    results = result["tool_results"]
+    assert json.loads(result["content"]) == [results[0]["result"], results[1]["content"], "boom", None]
+
+
+async def test_zone_step_returns_input_when_nothing_exceeds_threshold():
+    messages = _history()
+
+    result = await _preprocessor()._history_step_truncate_zone(
+        messages, indices=[1, 2, 3], msg_threshold=500, msg_target=100
+    )
+
+    assert result is messages
@@ -10,13 +10,17 @@ via a mock httpx client.
 """
 
 import asyncio
+import functools
 import json
 import time
 from typing import Any, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+import yaml
 
+from autolangchat.exceptions import ToolsGenerationError
 from autolangchat.graph.tools.generator import ToolsGenerator
 from autolangchat.graph.tools.manager import ToolManager
 
@@ -93,18 +97,32 @@ _POST_SPEC: Dict[str, Any] = {
 }
 
 
-def _make_generator(spec: Dict) -> ToolsGenerator:
+@functools.lru_cache(maxsize=1)
+def _base_config():
+    """Build and validate the shared test ``ChatConfig`` once per module."""
     from autolangchat.config import ChatConfig
 
-    config = ChatConfig(model_id="test-model", excluded_paths=[])
+    return ChatConfig(model_id="test-model", excluded_paths=[])
+
+
+def _config(**updates):
+    """Return a copy of the base config, so per-test tweaks never leak."""
+    return _base_config().model_copy(update=updates)
+
+
+def _make_generator(spec: Dict) -> ToolsGenerator:
+    config = _config()
     # generate_tools_desc() is called eagerly inside __init__
     return ToolsGenerator(openapi_spec=spec, config=config)
 
 
-def _make_manager(spec: Dict) -> ToolManager:
-    from autolangchat.config import ChatConfig
+def _stub_http(manager: ToolManager, body: Any) -> None:
+    """Make every request on *manager*'s HTTP client return a 200 with a JSON *body*."""
+    manager._http_client.request = AsyncMock(return_value=httpx.Response(200, json=body))
 
-    config = ChatConfig(model_id="test-model", excluded_paths=[])
+
+def _make_manager(spec: Dict) -> ToolManager:
+    config = _config()
     generator = ToolsGenerator(openapi_spec=spec, config=config)
     return ToolManager(
         generated_tools=generator._generated_tools,
@@ -174,6 +192,15 @@ class TestGenerateToolsDesc:
         assert first == second
         assert len(first["functions"]) > 0
 
+    def test_tools_desc_not_rebuilt_per_access(self):
+        gen = _make_generator(_GET_SPEC)
+        assert gen.tools_desc is gen.generate_tools_desc()
+
+    def test_metadata_available_without_explicit_generation(self):
+        gen = _make_generator(_GET_SPEC)
+        assert gen.get_tool_metadata("get_job")["path"] == "/jobs/{job_id}"
+        assert gen.get_tool_statistics()["total_tools"] == 2
+
     def test_invalidate_cache_rebuilds_schema(self):
         gen = _make_generator(_GET_SPEC)
         original = gen.tools_desc
@@ -184,6 +211,81 @@ class TestGenerateToolsDesc:
         assert len(rebuilt["functions"]) == len(original["functions"])
 
 
+class TestValidateToolCall:
+    def test_valid_arguments(self):
+        gen = _make_generator(_POST_SPEC)
+        assert gen.validate_tool_call("create_job", {"name": "build", "priority": 2}) is True
+
+    def test_missing_required_argument(self):
+        gen = _make_generator(_POST_SPEC)
+        assert gen.validate_tool_call("create_job", {"priority": 2}) is False
+
+    def test_wrong_argument_type(self):
+        gen = _make_generator(_POST_SPEC)
+        assert gen.validate_tool_call("create_job", {"name": "build", "priority": "high"}) is False
+
+    def test_unknown_arguments_are_ignored(self):
+        gen = _make_generator(_POST_SPEC)
+        assert gen.validate_tool_call("create_job", {"name": "build", "extra": object()}) is True
+
+    def test_unknown_tool(self):
+        gen = _make_generator(_POST_SPEC)
+        assert gen.validate_tool_call("no_such_tool", {}) is False
+
+    def test_validators_rebuilt_on_invalidate(self):
+        gen = _make_generator(_POST_SPEC)
+        before = gen._validators["create_job"]
+        gen.invalidate_cache()
+        assert gen._validators["create_job"] is not before
+        assert gen.validate_tool_call("create_job", {"name": "build"}) is True
+
+
+class TestSpecFileLoading:
+    """Spec files are written under pytest's ``tmp_path``, which is cleaned up automatically."""
+
+    def test_loads_json_spec_file(self, tmp_path):
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(json.dumps(_GET_SPEC), encoding="utf-8")
+        gen = _make_generator(str(spec_file))
+        assert {f["name"] for f in gen.tools_desc["functions"]} == {"list_jobs", "get_job"}
+
+    def test_loads_yaml_spec_file(self, tmp_path):
+        spec_file = tmp_path / "spec.yaml"
+        spec_file.write_text(yaml.safe_dump(_POST_SPEC), encoding="utf-8")
+        gen = _make_generator(spec_file)
+        assert [f["name"] for f in gen.tools_desc["functions"]] == ["create_job"]
+
+    def test_missing_spec_file_raises(self, tmp_path):
+        with pytest.raises(ToolsGenerationError, match="not found"):
+            _make_generator(str(tmp_path / "missing.json"))
+
+    def test_invalid_json_spec_file_raises(self, tmp_path):
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text("{not json", encoding="utf-8")
+        with pytest.raises(ToolsGenerationError, match="JSON"):
+            _make_generator(str(spec_file))
+
+
+class TestApiBaseUrl:
+    def test_falls_back_to_spec_servers_url(self):
+        spec = {**_GET_SPEC, "servers": [{"url": "http://spec-host"}]}
+        gen = _make_generator(spec)
+        assert gen.get_api_base_url() == "http://spec-host"
+
+    def test_result_is_cached(self):
+        gen = _make_generator({**_GET_SPEC, "servers": [{"url": "http://spec-host"}]})
+        assert gen.api_base_url == "http://spec-host"
+        with patch.object(gen, "_get_openapi_schema", side_effect=AssertionError("re-resolved")):
+            assert gen.get_api_base_url() == "http://spec-host"
+
+    def test_invalidate_cache_picks_up_config_changes(self):
+        gen = _make_generator({**_GET_SPEC, "servers": [{"url": "http://spec-host"}]})
+        assert gen.api_base_url == "http://spec-host"
+        gen.config.api_base_url = "http://explicit"
+        gen.invalidate_cache()
+        assert gen.get_api_base_url() == "http://explicit"
+
+
 # ---------------------------------------------------------------------------
 # ToolManager.generate_langchain_tools
 # ---------------------------------------------------------------------------
@@ -208,13 +310,7 @@ class TestToolManagerGenerateLangchainTools:
         tools = manager.generate_langchain_tools()
         tool_map = {t.name: t for t in tools}
 
-        fake_response = MagicMock()
-        fake_response.status_code = 200
-        fake_response.json.return_value = {"jobs": [{"id": 1}]}
-        fake_response.text = json.dumps({"jobs": [{"id": 1}]})
-
-        # Patch the HTTP client request method on the manager
-        manager._http_client.request = AsyncMock(return_value=fake_response)
+        _stub_http(manager, {"jobs": [{"id": 1}]})
 
         result = await tool_map["list_jobs"].ainvoke({"status": "running"})
         data = json.loads(result)
@@ -228,10 +324,7 @@ class TestToolManagerGenerateLangchainTools:
 
 def _make_manager_with_limit(limit):
     """Return a ToolManager whose max_tool_calls is set to *limit* (None = unlimited)."""
-    from autolangchat.config import ChatConfig
-
-    base_config = ChatConfig(model_id="test-model", excluded_paths=[])
-    config = base_config.model_copy(update={"max_tool_calls": limit})
+    config = _config(max_tool_calls=limit)
     generator = ToolsGenerator(openapi_spec=_GET_SPEC, config=config)
     return ToolManager(
         generated_tools=generator._generated_tools,
@@ -253,11 +346,7 @@ class TestToolManagerExecuteCap:
         """max_tool_calls=None must execute every call — no skipping."""
         manager = _make_manager_with_limit(None)
 
-        fake_response = MagicMock()
-        fake_response.status_code = 200
-        fake_response.json.return_value = {}
-        fake_response.text = "{}"
-        manager._http_client.request = AsyncMock(return_value=fake_response)
+        _stub_http(manager, {})
 
         calls = _make_calls(5)
         results = await manager.execute_tool_calls(calls)
@@ -270,11 +359,7 @@ class TestToolManagerExecuteCap:
         """With a cap of 2 and 5 calls the result list must still have 5 entries."""
         manager = _make_manager_with_limit(2)
 
-        fake_response = MagicMock()
-        fake_response.status_code = 200
-        fake_response.json.return_value = {}
-        fake_response.text = "{}"
-        manager._http_client.request = AsyncMock(return_value=fake_response)
+        _stub_http(manager, {})
 
         calls = _make_calls(5)
         results = await manager.execute_tool_calls(calls)
@@ -286,11 +371,7 @@ class TestToolManagerExecuteCap:
         """HTTP must be called only for the first *max_tool_calls* entries."""
         manager = _make_manager_with_limit(3)
 
-        fake_response = MagicMock()
-        fake_response.status_code = 200
-        fake_response.json.return_value = {}
-        fake_response.text = "{}"
-        manager._http_client.request = AsyncMock(return_value=fake_response)
+        _stub_http(manager, {})
 
         calls = _make_calls(6)
         await manager.execute_tool_calls(calls)
@@ -302,11 +383,7 @@ class TestToolManagerExecuteCap:
         """Calls beyond the cap must come back as error results (not successes)."""
         manager = _make_manager_with_limit(2)
 
-        fake_response = MagicMock()
-        fake_response.status_code = 200
-        fake_response.json.return_value = {}
-        fake_response.text = "{}"
-        manager._http_client.request = AsyncMock(return_value=fake_response)
+        _stub_http(manager, {})
 
         calls = _make_calls(4)
         results = await manager.execute_tool_calls(calls)
@@ -321,11 +398,7 @@ class TestToolManagerExecuteCap:
         """Every result tool_call_id must match the id of the corresponding input call."""
         manager = _make_manager_with_limit(2)
 
-        fake_response = MagicMock()
-        fake_response.status_code = 200
-        fake_response.json.return_value = {}
-        fake_response.text = "{}"
-        manager._http_client.request = AsyncMock(return_value=fake_response)
+        _stub_http(manager, {})
 
         calls = _make_calls(5)
         results = await manager.execute_tool_calls(calls)
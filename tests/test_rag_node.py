@@ -71,6 +71,7 @@ class _DummyChatConfig:
     kb_similarity_threshold = 0.5
     kb_semantic_weight = 0.7
     kb_keyword_weight = 0.3
+    kb_fusion_method = "weighted"
 
     def get_system_prompt(self):
         return "BASE PROMPT"
@@ -82,6 +83,13 @@ class _DummyEmbeddingClient:
 
 
 class _DummyKBStore:
+    @staticmethod
+    def hybrid_candidate_limit(limit):
+        return limit * 3
+
+    def keyword_search(self, **kwargs):
+        return []
+
     def hybrid_search(self, **kwargs):
         return [
             {
@@ -123,3 +131,64 @@ async def test_rag_node_preserves_user_message_when_injecting_context():
         for message in result["messages"]
     )
     assert result["kb_results"]
+
+
+@pytest.mark.asyncio
+async def test_rag_node_skips_query_embedding_when_semantic_weight_is_zero():
+    class _KeywordOnlyConfig(_DummyChatConfig):
+        kb_semantic_weight = 0.0
+        kb_keyword_weight = 1.0
+
+    class _RecordingKBStore(_DummyKBStore):
+        def hybrid_search(self, **kwargs):
+            self.kwargs = kwargs
+            return super().hybrid_search(**kwargs)
+
+    class _FailingEmbeddingClient:
+        async def generate_embedding(self, text, model_id):
+            raise AssertionError("query should not be embedded for keyword-only search")
+
+    kb_store = _RecordingKBStore()
+    state = {"messages": [{"role": "user", "content": "status codes"}], "metadata": {}}
+    config = {
+        "configurable": {
+            "chat_config": _KeywordOnlyConfig(),
+            "kb_store": kb_store,
+            "embedding_client": _FailingEmbeddingClient(),
+        }
+    }
+
+    result = await rag_node(state, config)
+
+    assert result["kb_results"]
+    assert kb_store.kwargs["query_embedding"] is None
+
+
+@pytest.mark.asyncio
+async def test_rag_node_passes_prefetched_keyword_results_to_hybrid_search():
+    keyword_hits = [{"chunk_id": "chunk-1", "keyword_score": 0.4}]
+
+    class _PrefetchKBStore(_DummyKBStore):
+        def keyword_search(self, **kwargs):
+            self.keyword_kwargs = kwargs
+            return keyword_hits
+
+        def hybrid_search(self, **kwargs):
+            self.hybrid_kwargs = kwargs
+            return super().hybrid_search(**kwargs)
+
+    kb_store = _PrefetchKBStore()
+    state = {"messages": [{"role": "user", "content": "status codes"}], "metadata": {}}
+    config = {
+        "configurable": {
+            "chat_config": _DummyChatConfig(),
+            "kb_store": kb_store,
+            "embedding_client": _DummyEmbeddingClient(),
+        }
+    }
+
+    await rag_node(state, config)
+
+    assert kb_store.keyword_kwargs["limit"] == _DummyChatConfig.kb_top_k_results * 3
+    assert kb_store.hybrid_kwargs["keyword_results"] is keyword_hits
+    assert kb_store.hybrid_kwargs["query_embedding"] == [0.1, 0.2, 0.3]
@@ -0,0 +1,276 @@
+"""Unit tests for ``WebSocketChatHandler._handle_auth_message`` remote verification.
+
+Covers the ``auth_verification_cache_ttl`` cache in front of
+``auth_verification_endpoint``:
+
+  (a) disabled by default — every auth message hits the endpoint;
+  (b) when enabled, repeat credentials within the TTL reuse the earlier
+      successful result (including ``verified_user_info``);
+  (c) failed or timed-out verifications and different credentials are
+      never served from the cache, and expired entries are re-verified;
+  (d) the cache is bounded: expired entries are swept and, at the cap,
+      the oldest entry is evicted;
+  (e) malformed payloads (missing or non-string credential fields) are
+      rejected before the endpoint is called;
+  (f) the handler's ``httpx.AsyncClient`` is only built on first use;
+  (g) each auth type stores matching ``Credentials`` on the session.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from autolangchat import websocket_handler
+from autolangchat.auth_handler import AuthType
+from autolangchat.websocket_handler import WebSocketChatHandler
+
+
+def _make_config(**overrides):
+    config = MagicMock()
+    config.timeout = 30.0
+    config.model_id = "us.anthropic.claude-sonnet-4-6"
+    config.auth_verification_endpoint = "https://auth.example.com/verify"
+    config.auth_verification_cache_ttl = 0
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return config
+
+
+def _make_session():
+    return SimpleNamespace(
+        session_id="ws-session-1",
+        user_id=None,
+        credentials=None,
+        auth_handler=None,
+        metadata={},
+    )
+
+
+def _response(status_code=200, body=None):
+    return httpx.Response(status_code, json=body if body is not None else {"user_id": "alice", "name": "Alice"})
+
+
+class _StubHTTPClient:
+    """Plays back scripted ``get`` outcomes, then a default 200, recording each URL."""
+
+    def __init__(self, *outcomes):
+        self._outcomes = list(outcomes)
+        self.calls = []
+
+    async def get(self, url, headers=None):
+        self.calls.append(url)
+        outcome = self._outcomes.pop(0) if self._outcomes else _response()
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class _StubSessionManager:
+    """Just the ``ChatSessionManager`` surface the auth path awaits."""
+
+    def __init__(self, session):
+        self._session = session
+
+    async def get_session(self, websocket):
+        return self._session
+
+    async def update_session_user_id(self, session_id, user_id):
+        self._session.user_id = user_id
+
+    async def shutdown(self):
+        pass
+
+
+class _StubWebSocket:
+    """Records every ``send_json`` payload in ``sent``."""
+
+    __slots__ = ("sent", "cookies")
+
+    def __init__(self):
+        self.sent = []
+        self.cookies = {}
+
+    async def send_json(self, message):
+        self.sent.append(message)
+
+
+def _make_handler(config, *responses):
+    session = _make_session()
+    handler = WebSocketChatHandler(session_manager=_StubSessionManager(session), config=config, chat_graph=None)
+    handler.http_client = _StubHTTPClient(*responses)
+    return handler, session
+
+
+def _sent_types(ws):
+    return [m["type"] for m in ws.sent]
+
+
+_BEARER = {"type": "auth", "auth_type": "bearer_token", "token": "tok-1"}
+
+
+async def test_cache_disabled_by_default_verifies_every_message():
+    handler, _ = _make_handler(_make_config())
+    ws = _StubWebSocket()
+
+    await handler._handle_auth_message(ws, _BEARER)
+    await handler._handle_auth_message(ws, _BEARER)
+
+    assert len(handler.http_client.calls) == 2
+    assert _sent_types(ws) == ["auth_configured", "auth_configured"]
+
+
+async def test_repeat_credentials_reuse_cached_verification():
+    handler, session = _make_handler(_make_config(auth_verification_cache_ttl=120))
+    ws = _StubWebSocket()
+
+    await handler._handle_auth_message(ws, _BEARER)
+    session.metadata.clear()
+    await handler._handle_auth_message(ws, _BEARER)
+
+    assert len(handler.http_client.calls) == 1
+    assert _sent_types(ws) == ["auth_configured", "auth_configured"]
+    assert session.metadata["verified_user_info"] == {"user_id": "alice", "name": "Alice"}
+
+
+async def test_failures_and_other_credentials_are_not_cached():
+    handler, _ = _make_handler(
+        _make_config(auth_verification_cache_ttl=120),
+        _response(401, {"detail": "bad token"}),
+        _response(),
+        _response(),
+    )
+    ws = _StubWebSocket()
+
+    await handler._handle_auth_message(ws, _BEARER)
+    await handler._handle_auth_message(ws, _BEARER)
+    await handler._handle_auth_message(ws, {**_BEARER, "token": "tok-2"})
+
+    assert len(handler.http_client.calls) == 3
+    assert _sent_types(ws) == ["auth_failed", "auth_configured", "auth_configured"]
+
+
+async def test_expired_entry_is_verified_again(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(websocket_handler.time, "monotonic", lambda: clock[0])
+    handler, _ = _make_handler(_make_config(auth_verification_cache_ttl=60))
+    ws = _StubWebSocket()
+
+    await handler._handle_auth_message(ws, _BEARER)
+    clock[0] += 61
+    await handler._handle_auth_message(ws, _BEARER)
+
+    assert len(handler.http_client.calls) == 2
+
+
+@pytest.mark.parametrize(
+    "payload, error",
+    [
+        ({"auth_type": "bearer_token"}, "Bearer token required"),
+        ({"auth_type": "bearer_token", "token": {"nested": "x"}}, "Bearer token required"),
+        ({"auth_type": "basic_auth", "username": "alice"}, "Username and password required for basic auth"),
+        ({"auth_type": "api_key", "api_key": 12345}, "API key required"),
+        (
+            {"auth_type": "oauth2", "client_id": "c", "client_secret": "s"},
+            "client_id, client_secret, and token_url required for OAuth2",
+        ),
+    ],
+)
+async def test_malformed_payload_is_rejected_before_verification(payload, error):
+    handler, session = _make_handler(_make_config())
+    ws = _StubWebSocket()
+
+    await handler._handle_auth_message(ws, {"type": "auth", **payload})
+
+    assert handler.http_client.calls == []
+    assert ws.sent[-1]["type"] == "error"
+    assert ws.sent[-1]["message"] == error
+    assert session.credentials is None
+
+
+async def test_http_client_is_created_on_first_use():
+    handler = WebSocketChatHandler(
+        session_manager=_StubSessionManager(_make_session()), config=_make_config(), chat_graph=None
+    )
+
+    assert handler._http_client is None
+    await handler.shutdown()  # nothing to close yet
+
+    client = handler.http_client
+    assert isinstance(client, httpx.AsyncClient)
+    assert handler.http_client is client
+    await handler.shutdown()
+    assert client.is_closed
+
+
+@pytest.mark.parametrize(
+    "payload, expected_type, expected_fields",
+    [
+        ({"auth_type": "bearer_token", "token": "tok-1"}, AuthType.BEARER_TOKEN, {"bearer_token": "tok-1"}),
+        (
+            {"auth_type": "basic_auth", "username": "alice", "password": "pw"},
+            AuthType.BASIC_AUTH,
+            {"username": "alice", "password": "pw"},
+        ),
+        (
+            {"auth_type": "api_key", "api_key": "k-1", "api_key_header": "X-Key"},
+            AuthType.API_KEY,
+            {"api_key": "k-1", "api_key_header": "X-Key"},
+        ),
+        (
+            {"auth_type": "oauth2", "client_id": "c", "client_secret": "s", "token_url": "https://idp/token"},
+            AuthType.OAUTH2_CLIENT_CREDENTIALS,
+            {"client_id": "c", "client_secret": "s", "token_url": "https://idp/token"},
+        ),
+        (
+            {"auth_type": "custom", "custom_headers": {"X-Tenant": "t1"}},
+            AuthType.CUSTOM,
+            {"custom_headers": {"X-Tenant": "t1"}},
+        ),
+    ],
+)
+async def test_auth_types_store_matching_credentials(payload, expected_type, expected_fields):
+    handler, session = _make_handler(_make_config(auth_verification_endpoint=None))
+    ws = _StubWebSocket()
+
+    await handler._handle_auth_message(ws, {"type": "auth", **payload})
+
+    assert _sent_types(ws) == ["auth_configured"]
+    assert session.credentials.auth_type == expected_type
+    assert {name: getattr(session.credentials, name) for name in expected_fields} == expected_fields
+    assert handler.http_client.calls == []
+
+
+async def test_verification_timeout_fails_and_is_not_cached():
+    handler, session = _make_handler(
+        _make_config(auth_verification_cache_ttl=120), httpx.ReadTimeout("slow"), _response()
+    )
+    ws = _StubWebSocket()
+
+    await handler._handle_auth_message(ws, _BEARER)
+    await handler._handle_auth_message(ws, _BEARER)
+
+    assert _sent_types(ws) == ["auth_failed", "auth_configured"]
+    assert "timed out" in ws.sent[0]["message"]
+    assert len(handler.http_client.calls) == 2
+
+
+async def test_cache_evicts_expired_then_oldest_entries(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(websocket_handler.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(websocket_handler, "_AUTH_VERIFICATION_CACHE_MAX_SIZE", 2)
+    handler, _ = _make_handler(_make_config(auth_verification_cache_ttl=60))
+    ws = _StubWebSocket()
+
+    await handler._handle_auth_message(ws, {**_BEARER, "token": "stale"})
+    clock[0] += 61
+    for token in ("a", "b", "c"):
+        await handler._handle_auth_message(ws, {**_BEARER, "token": token})
+
+    assert len(handler._auth_verification_cache) == 2
+    calls = len(handler.http_client.calls)
+    await handler._handle_auth_message(ws, {**_BEARER, "token": "c"})
+    assert len(handler.http_client.calls) == calls  # newest entry still cached
+    await handler._handle_auth_message(ws, {**_BEARER, "token": "a"})
+    assert len(handler.http_client.calls) == calls + 1  # oldest was evicted
@@ -43,6 +43,7 @@ import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
+from autolangchat.db import SQLiteConversationStore
 from autolangchat.websocket_handler import WebSocketChatHandler
 
 
@@ -135,8 +136,6 @@ def _sent(ws):
 
 
 async def _make_store():
-    from autolangchat.db import SQLiteConversationStore
-
     store = SQLiteConversationStore(db_path=":memory:")
     await store.open()
     return store
@@ -38,6 +38,19 @@ def _assistant_graph_state():
     }
 
 
+def _returning(value):
+    """A bare coroutine function for one-shot awaits nobody inspects."""
+
+    async def _call(*args, **kwargs):
+        return value
+
+    return _call
+
+
+# Built once per module; each handler derives its variant via ``model_copy``.
+_BASE_CONFIG = ChatConfig()
+
+
 def _make_handler(enable_dynamic_overrides=True, allowed_dynamic_overrides=None):
     # NOTE: ChatConfig fields all declare a pydantic ``alias`` (e.g.
     # AUTOCHAT_ENABLE_DYNAMIC_OVERRIDES), and pydantic-settings only accepts
@@ -46,7 +59,7 @@ def _make_handler(enable_dynamic_overrides=True, allowed_dynamic_overrides=None)
     # silently falls back to the default. Use ``model_copy(update=...)`` instead,
     # which updates by field name and matches how the handler itself builds
     # `effective_config`.
-    config = ChatConfig().model_copy(
+    config = _BASE_CONFIG.model_copy(
         update={
             "enable_dynamic_overrides": enable_dynamic_overrides,
             "allowed_dynamic_overrides": allowed_dynamic_overrides,
@@ -56,7 +69,7 @@ def _make_handler(enable_dynamic_overrides=True, allowed_dynamic_overrides=None)
     session = ChatSession(session_id="session-123", websocket=MagicMock())
 
     session_manager = MagicMock()
-    session_manager.get_session = AsyncMock(return_value=session)
+    session_manager.get_session = _returning(session)
 
     chat_graph = MagicMock()
     chat_graph.ainvoke = AsyncMock(return_value=_assistant_graph_state())